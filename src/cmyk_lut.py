@@ -0,0 +1,325 @@
+"""
+Module de conversion CMJN par table de correspondance (LUT) échantillonnée.
+
+Une LUT RGB -> CMJN est une grille N^3 et une LUT CMJN -> RGB une grille M^4,
+fournies en CSV (une ligne par nœud de la grille, avec en-tête
+'r,g,b,c,m,y,k' ou 'c,m,y,k,r,g,b'). Les tables sont compilées en float32
+dans un cache binaire voisin, mappé en mémoire une fois chargé, puis
+interpolées de façon tétraédrique.
+"""
+
+import argparse
+import csv
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.color_converter import ColorConverter
+from src.color_precision import Buffer, PrecisionConverter
+
+CACHE_MAGIC = b'CLUT'
+CACHE_VERSION = 1
+# signature, version, dimensions d'entrée, taille de grille, canaux de sortie
+CACHE_HEADER = struct.Struct('<4sHHII')
+CACHE_SUFFIX = '.lutcache'
+
+RGB_HEADER = ['r', 'g', 'b', 'c', 'm', 'y', 'k']
+CMYK_HEADER = ['c', 'm', 'y', 'k', 'r', 'g', 'b']
+
+
+class LutTable:
+    """Grille échantillonnée mappée en mémoire (float32, sorties entrelacées)."""
+
+    def __init__(self, dims: int, size: int, channels: int, data: memoryview,
+                 handle: Optional[mmap.mmap] = None) -> None:
+        self.dims = dims
+        self.size = size
+        self.channels = channels
+        self.data = data
+        self._handle = handle
+        # Pas (en nombre de flottants) pour chaque axe de la grille
+        self.strides = [channels * size ** (dims - 1 - axis) for axis in range(dims)]
+
+    def close(self) -> None:
+        """Libère la vue et le mappage mémoire."""
+        self.data.release()
+        if self._handle is not None:
+            self._handle.close()
+
+    def tetrahedral(self, coords: Sequence[float], base: int = 0) -> List[float]:
+        """
+        Interpolation tétraédrique sur les trois premiers axes (coordonnées 0-1).
+
+        base décale l'origine dans la table (utilisé pour les tranches K en 4D).
+        """
+        top = self.size - 1
+        positions = [min(max(c, 0.0), 1.0) * top for c in coords[:3]]
+        cells = [min(int(p), top - 1) if top else 0 for p in positions]
+        fx, fy, fz = (p - c for p, c in zip(positions, cells))
+        sx, sy, sz = self.strides[-3:]
+
+        o000 = base + cells[0] * sx + cells[1] * sy + cells[2] * sz
+        o111 = o000 + sx + sy + sz
+
+        # Choix du tétraèdre selon l'ordre des fractions
+        if fx >= fy:
+            if fy >= fz:
+                steps = ((fx, o000 + sx), (fy, o000 + sx + sy), (fz, o111))
+            elif fx >= fz:
+                steps = ((fx, o000 + sx), (fz, o000 + sx + sz), (fy, o111))
+            else:
+                steps = ((fz, o000 + sz), (fx, o000 + sx + sz), (fy, o111))
+        else:
+            if fz >= fy:
+                steps = ((fz, o000 + sz), (fy, o000 + sy + sz), (fx, o111))
+            elif fz >= fx:
+                steps = ((fy, o000 + sy), (fz, o000 + sy + sz), (fx, o111))
+            else:
+                steps = ((fy, o000 + sy), (fx, o000 + sx + sy), (fz, o111))
+
+        data = self.data
+        channels = self.channels
+        previous = o000
+        result = list(data[o000:o000 + channels])
+        for weight, offset in steps:
+            if weight:
+                for ch in range(channels):
+                    result[ch] += weight * (data[offset + ch] - data[previous + ch])
+            previous = offset
+        return result
+
+    def interpolate(self, coords: Sequence[float]) -> List[float]:
+        """Interpole en 3D (tétraédrique) ou 4D (tétraédrique par tranche K, linéaire en K)."""
+        if self.dims == 3:
+            return self.tetrahedral(coords)
+
+        top = self.size - 1
+        position = min(max(coords[0], 0.0), 1.0) * top
+        cell = min(int(position), top - 1)
+        fraction = position - cell
+        stride = self.strides[0]
+
+        low = self.tetrahedral(coords[1:], cell * stride)
+        if not fraction:
+            return low
+        high = self.tetrahedral(coords[1:], (cell + 1) * stride)
+        return [a + fraction * (b - a) for a, b in zip(low, high)]
+
+
+def _read_csv_table(path: str) -> Tuple[int, int, int, array]:
+    """Lit une LUT CSV et retourne (dimensions, taille, canaux, données ordonnées)."""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = [row for row in csv.reader(f)
+                if row and not row[0].lstrip().startswith('#')]
+
+    header = [cell.strip().lower() for cell in rows[0]]
+    if header == RGB_HEADER:
+        dims, channels, in_scale = 3, 4, 255.0
+    elif header == CMYK_HEADER:
+        dims, channels, in_scale = 4, 3, 100.0
+    else:
+        raise ValueError(f"En-tête de LUT inconnu: {','.join(header)}")
+
+    body = rows[1:]
+    size = round(len(body) ** (1 / dims))
+    if size < 2 or size ** dims != len(body):
+        raise ValueError(f"La LUT doit contenir une grille complète ({len(body)} lignes)")
+
+    data = array('f', bytes(4 * channels * len(body)))
+    top = size - 1
+    # Sorties normalisées 0-1 (CMJN en %, RGB en 0-255)
+    out_scale = 100.0 if dims == 3 else 255.0
+    for row in body:
+        values = [float(cell) for cell in row]
+        # Axes de la grille : R, G, B ou K, C, M, J (K en premier pour l'interpolation 4D)
+        axes = values[:3] if dims == 3 else [values[3]] + values[:3]
+        index = 0
+        for value in axes:
+            index = index * size + round(value / in_scale * top)
+        data[index * channels:(index + 1) * channels] = array(
+            'f', [v / out_scale for v in values[dims:]])
+    return dims, size, channels, data
+
+
+def _write_cache(path: str, dims: int, size: int, channels: int, data: array) -> None:
+    """Écrit le cache binaire compilé d'une LUT."""
+    with open(path, 'wb') as f:
+        f.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, dims, size, channels))
+        data.tofile(f)
+
+
+def _map_cache(path: str) -> LutTable:
+    """Mappe en mémoire le cache binaire d'une LUT (ValueError s'il est invalide ou tronqué)."""
+    with open(path, 'rb') as f:
+        handle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(handle) < CACHE_HEADER.size:
+        handle.close()
+        raise ValueError("Cache de LUT tronqué")
+    magic, version, dims, size, channels = CACHE_HEADER.unpack_from(handle)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        handle.close()
+        raise ValueError("Cache de LUT invalide")
+    if len(handle) != CACHE_HEADER.size + 4 * channels * size ** dims:
+        handle.close()
+        raise ValueError("Cache de LUT tronqué")
+    data = memoryview(handle)[CACHE_HEADER.size:].cast('f')
+    return LutTable(dims, size, channels, data, handle)
+
+
+_TABLES: Dict[str, LutTable] = {}
+
+
+def load_table(path: str) -> LutTable:
+    """Charge une LUT CSV via son cache binaire (recompilé s'il est périmé ou invalide)."""
+    path = os.path.abspath(path)
+    if path in _TABLES:
+        return _TABLES[path]
+
+    cache_path = path + CACHE_SUFFIX
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+        _write_cache(cache_path, *_read_csv_table(path))
+
+    try:
+        table = _map_cache(cache_path)
+    except ValueError:
+        # Écriture interrompue ou cache d'une autre version : on recompile
+        _write_cache(cache_path, *_read_csv_table(path))
+        table = _map_cache(cache_path)
+    _TABLES[path] = table
+    return table
+
+
+class CmykLut:
+    """
+    Moteur CMJN piloté par profil, utilisable comme backend de ColorConverter.
+
+    Une direction sans LUT retombe sur la formule de PrecisionConverter.
+    """
+
+    def __init__(self, rgb_to_cmyk_path: Optional[str] = None,
+                 cmyk_to_rgb_path: Optional[str] = None) -> None:
+        self.forward = load_table(rgb_to_cmyk_path) if rgb_to_cmyk_path else None
+        self.inverse = load_table(cmyk_to_rgb_path) if cmyk_to_rgb_path else None
+        if self.forward is not None and self.forward.dims != 3:
+            raise ValueError("La LUT RGB -> CMJN doit être une grille 3D")
+        if self.inverse is not None and self.inverse.dims != 4:
+            raise ValueError("La LUT CMJN -> RGB doit être une grille 4D")
+
+    def rgb_to_cmyk_unrounded(self, r: float, g: float,
+                              b: float) -> Tuple[float, float, float, float]:
+        """Convertit RGB (0-255) en CMJN (%) sans arrondi."""
+        if self.forward is None:
+            return PrecisionConverter.rgb_to_cmyk(r / 255.0, g / 255.0, b / 255.0)
+        c, m, y, k = self.forward.interpolate((r / 255.0, g / 255.0, b / 255.0))
+        return (c * 100, m * 100, y * 100, k * 100)
+
+    def cmyk_to_rgb_unrounded(self, c: float, m: float, y: float,
+                              k: float) -> Tuple[float, float, float]:
+        """Convertit CMJN (%) en RGB (0-255) sans arrondi."""
+        if self.inverse is None:
+            r, g, b = PrecisionConverter.cmyk_to_rgb(c, m, y, k)
+        else:
+            # Axes de la grille 4D dans l'ordre K, C, M, J
+            r, g, b = self.inverse.interpolate((k / 100.0, c / 100.0, m / 100.0, y / 100.0))
+        return (r * 255, g * 255, b * 255)
+
+    def rgb_to_cmyk(self, r: int, g: int, b: int) -> Tuple[float, float, float, float]:
+        """Convertit RGB en CMJN, arrondi comme ColorConverter.rgb_to_cmyk."""
+        c, m, y, k = self.rgb_to_cmyk_unrounded(r, g, b)
+        return (round(c, 1), round(m, 1), round(y, 1), round(k, 1))
+
+    def cmyk_to_rgb(self, c: float, m: float, y: float, k: float) -> Tuple[int, int, int]:
+        """Convertit CMJN en RGB 8 bits, arrondi comme ColorConverter.cmyk_to_rgb."""
+        r, g, b = self.cmyk_to_rgb_unrounded(c, m, y, k)
+        return (
+            max(0, min(255, round(r))),
+            max(0, min(255, round(g))),
+            max(0, min(255, round(b)))
+        )
+
+    def convert_buffer(self, data: Buffer, direction: str = 'rgb_to_cmyk',
+                       typecode: str = 'f') -> array:
+        """Convertit un tampon entrelacé (RGB 0-255 ou CMJN %) sans arrondi."""
+        if direction == 'rgb_to_cmyk':
+            func, channels = self.rgb_to_cmyk_unrounded, 3
+        elif direction == 'cmyk_to_rgb':
+            func, channels = self.cmyk_to_rgb_unrounded, 4  # type: ignore[assignment]
+        else:
+            raise ValueError(f"Direction inconnue: {direction}")
+
+        # Parcours direct de la vue par pas de channels : aucune copie intermédiaire
+        view = memoryview(data)
+        output = array(typecode)
+        for i in range(0, len(view) - channels + 1, channels):
+            output.extend(func(*view[i:i + channels]))
+        return output
+
+
+def generate_lut(path: str, direction: str = 'rgb_to_cmyk', size: int = 17,
+                 gcr: float = 1.0) -> None:
+    """
+    Génère une LUT CSV à partir de la formule de référence.
+
+    gcr (0-1) règle la génération du noir : 1 reproduit la formule naïve,
+    une valeur plus faible laisse davantage de CMJ dans les tons sombres.
+    """
+    if size < 2:
+        raise ValueError("La grille doit avoir au moins 2 nœuds par axe")
+    steps = [i / (size - 1) for i in range(size)]
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if direction == 'rgb_to_cmyk':
+            writer.writerow(RGB_HEADER)
+            for r in steps:
+                for g in steps:
+                    for b in steps:
+                        k = gcr * (1 - max(r, g, b))
+                        if k >= 1:
+                            cmyk = (0.0, 0.0, 0.0, 100.0)
+                        else:
+                            cmyk = tuple(min(100.0, max(0.0, (1 - v - k) / (1 - k) * 100))
+                                         for v in (r, g, b)) + (k * 100,)
+                        writer.writerow([round(r * 255, 3), round(g * 255, 3), round(b * 255, 3),
+                                         *(round(v, 4) for v in cmyk)])
+        elif direction == 'cmyk_to_rgb':
+            writer.writerow(CMYK_HEADER)
+            for c in steps:
+                for m in steps:
+                    for y in steps:
+                        for k in steps:
+                            rgb = PrecisionConverter.cmyk_to_rgb(c * 100, m * 100,
+                                                                 y * 100, k * 100)
+                            writer.writerow([round(c * 100, 3), round(m * 100, 3),
+                                             round(y * 100, 3), round(k * 100, 3),
+                                             *(round(v * 255, 4) for v in rgb)])
+        else:
+            raise ValueError(f"Direction inconnue: {direction}")
+
+
+def use_lut(rgb_to_cmyk_path: Optional[str] = None,
+            cmyk_to_rgb_path: Optional[str] = None) -> CmykLut:
+    """Active un moteur LUT derrière parse_input('cmyk') et convert_all."""
+    backend = CmykLut(rgb_to_cmyk_path, cmyk_to_rgb_path)
+    ColorConverter.set_cmyk_backend(backend)
+    return backend
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande : génération de LUT."""
+    parser = argparse.ArgumentParser(description='Génération de LUT CMJN')
+    parser.add_argument('path', help='Fichier CSV à écrire')
+    parser.add_argument('--direction', choices=['rgb_to_cmyk', 'cmyk_to_rgb'],
+                        default='rgb_to_cmyk', help='Sens de conversion')
+    parser.add_argument('--size', type=int, default=17, help='Nœuds par axe')
+    parser.add_argument('--gcr', type=float, default=1.0, help='Génération du noir (0-1)')
+    args = parser.parse_args()
+
+    generate_lut(args.path, args.direction, args.size, args.gcr)
+    print(f"✓ LUT écrite dans {args.path}")
+
+
+if __name__ == "__main__":
+    main()
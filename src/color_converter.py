@@ -4,7 +4,9 @@ Supporte : HEX, RGB, CMYK, HSL, HSV
 """
 
 import re
-from typing import Tuple, Dict, Any, List
+from typing import Tuple, Dict, Any, List, Optional, Sequence
+
+from src.color_formats import ColorFormat, FormatRegistry
 
 RE_FLOAT_NUMBER = r'[\d.]+'
 
@@ -12,23 +14,48 @@ RE_FLOAT_NUMBER = r'[\d.]+'
 class ColorConverter:
     """Classe principale pour la conversion de couleurs."""
 
+    # Moteur CMJN optionnel (ex. CmykLut) ; None = formule de référence
+    _cmyk_backend: Optional[Any] = None
+
+    @classmethod
+    def set_cmyk_backend(cls, backend: Optional[Any]) -> None:
+        """
+        Remplace la conversion CMJN par un moteur externe, ou rétablit la formule (None).
+
+        Le moteur fournit rgb_to_cmyk, cmyk_to_rgb et cmyk_to_rgb_unrounded.
+        """
+        cls._cmyk_backend = backend
+
     @staticmethod
     def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-        """Convertit une couleur hexadécimale en RGB."""
+        """
+        Convertit une couleur hexadécimale opaque (#RGB, #RRGGBB) en RGB.
+
+        Les formes avec alpha sont refusées : utiliser hex_to_rgba.
+        """
+        if len(hex_color.lstrip('#')) not in (3, 6):
+            raise ValueError(f"Format hexadécimal invalide: {hex_color.lstrip('#')}")
+        r, g, b, _ = ColorConverter.hex_to_rgba(hex_color)
+        return (r, g, b)
+
+    @staticmethod
+    def hex_to_rgba(hex_color: str) -> Tuple[int, int, int, float]:
+        """Convertit une couleur hexadécimale (#RGB, #RGBA, #RRGGBB, #RRGGBBAA) en RGBA."""
         hex_color = hex_color.lstrip('#')
 
-        # Support format court (#RGB)
-        if len(hex_color) == 3:
+        # Support formats courts (#RGB, #RGBA)
+        if len(hex_color) in (3, 4):
             hex_color = ''.join([c * 2 for c in hex_color])
 
-        if len(hex_color) != 6:
+        if len(hex_color) not in (6, 8):
             raise ValueError(f"Format hexadécimal invalide: {hex_color}")
 
         try:
             r = int(hex_color[0:2], 16)
             g = int(hex_color[2:4], 16)
             b = int(hex_color[4:6], 16)
-            return (r, g, b)
+            a = int(hex_color[6:8], 16) / 255.0 if len(hex_color) == 8 else 1.0
+            return (r, g, b, round(a, 3))
         except ValueError as e:
             raise ValueError(f"Format hexadécimal invalide: {hex_color}") from e
 
@@ -39,9 +66,19 @@ class ColorConverter:
             raise ValueError("Les valeurs RGB doivent être entre 0 et 255")
         return f"#{r:02X}{g:02X}{b:02X}"
 
+    @staticmethod
+    def rgba_to_hex(r: int, g: int, b: int, a: float) -> str:
+        """Convertit RGBA (alpha entre 0 et 1) en hexadécimal #RRGGBBAA."""
+        if not 0 <= a <= 1:
+            raise ValueError("La valeur alpha doit être entre 0 et 1")
+        return f"{ColorConverter.rgb_to_hex(r, g, b)}{round(a * 255):02X}"
+
     @staticmethod
     def rgb_to_cmyk(r: int, g: int, b: int) -> Tuple[float, float, float, float]:
         """Convertit RGB en CMJN (CMYK)."""
+        if ColorConverter._cmyk_backend is not None:
+            return ColorConverter._cmyk_backend.rgb_to_cmyk(r, g, b)
+
         if r == 0 and g == 0 and b == 0:
             return (0.0, 0.0, 0.0, 100.0)
 
@@ -72,6 +109,9 @@ class ColorConverter:
     @staticmethod
     def cmyk_to_rgb(c: float, m: float, y: float, k: float) -> Tuple[int, int, int]:
         """Convertit CMJN (CMYK) en RGB."""
+        if ColorConverter._cmyk_backend is not None:
+            return ColorConverter._cmyk_backend.cmyk_to_rgb(c, m, y, k)
+
         # Convertir de pourcentage en 0-1
         c = c / 100.0
         m = m / 100.0
@@ -222,6 +262,43 @@ class ColorConverter:
             max(0, min(255, b))
         )
 
+    @staticmethod
+    def hsl_to_hsv(h: float, s: float, l: float) -> Tuple[float, float, float]:
+        """Convertit HSL en HSV directement, sans passer par RGB 8 bits."""
+        s = s / 100.0
+        l = l / 100.0
+        v = l + s * min(l, 1 - l)
+        s_v = 0 if v == 0 else 2 * (1 - l / v)
+        return (round(h, 1), round(s_v * 100, 1), round(v * 100, 1))
+
+    @staticmethod
+    def hsv_to_hsl(h: float, s: float, v: float) -> Tuple[float, float, float]:
+        """Convertit HSV en HSL directement, sans passer par RGB 8 bits."""
+        s = s / 100.0
+        v = v / 100.0
+        l = v * (1 - s / 2)
+        s_l = 0 if l in (0, 1) else (v - l) / min(l, 1 - l)
+        return (round(h, 1), round(s_l * 100, 1), round(l * 100, 1))
+
+    @staticmethod
+    def _cmyk_to_rgb_unrounded(c: float, m: float, y: float,
+                               k: float) -> Tuple[float, float, float]:
+        """Convertit CMJN en RGB (0-255) sans quantification."""
+        if ColorConverter._cmyk_backend is not None:
+            return ColorConverter._cmyk_backend.cmyk_to_rgb_unrounded(c, m, y, k)
+        k = 1 - k / 100.0
+        return (255 * (1 - c / 100.0) * k, 255 * (1 - m / 100.0) * k, 255 * (1 - y / 100.0) * k)
+
+    @classmethod
+    def cmyk_to_hsl(cls, c: float, m: float, y: float, k: float) -> Tuple[float, float, float]:
+        """Convertit CMJN en HSL sans arrondir l'étape RGB intermédiaire."""
+        return cls.rgb_to_hsl(*cls._cmyk_to_rgb_unrounded(c, m, y, k))  # type: ignore[arg-type]
+
+    @classmethod
+    def cmyk_to_hsv(cls, c: float, m: float, y: float, k: float) -> Tuple[float, float, float]:
+        """Convertit CMJN en HSV sans arrondir l'étape RGB intermédiaire."""
+        return cls.rgb_to_hsv(*cls._cmyk_to_rgb_unrounded(c, m, y, k))  # type: ignore[arg-type]
+
     @classmethod
     def convert_all(cls, r: int, g: int, b: int) -> Dict[str, Any]:
         """Convertit RGB vers tous les formats."""
@@ -233,56 +310,85 @@ class ColorConverter:
             'hsv': cls.rgb_to_hsv(r, g, b)
         }
 
+    @classmethod
+    def convert_all_rgba(cls, r: int, g: int, b: int, a: float) -> Dict[str, Any]:
+        """Convertit RGBA vers tous les formats (l'alpha est conservé à part)."""
+        results = cls.convert_all(r, g, b)
+        results['rgba'] = (r, g, b, a)
+        results['hexa'] = cls.rgba_to_hex(r, g, b, a)
+        return results
+
     @classmethod
     def parse_input(cls, input_str: str, format_type: str) -> Tuple[int, int, int]:
         """Parse une entrée utilisateur et retourne RGB."""
+        return FORMAT_REGISTRY.parse(input_str.strip(), format_type, 'rgb')
+
+    @staticmethod
+    def detect_format(input_str: str) -> str:
+        """Devine le format d'une valeur de couleur (hex, rgb(), hsl(), hsv(), R, G, B)."""
+        lowered = input_str.strip().lower()
+        for prefix in ('hsl', 'hsv', 'rgb'):
+            if lowered.startswith(prefix):
+                return prefix
+        return 'rgb' if ',' in lowered else 'hex'
+
+    @classmethod
+    def parse_input_rgba(cls, input_str: str, format_type: str) -> Tuple[int, int, int, float]:
+        """Parse une entrée utilisateur et retourne RGBA (alpha 1.0 si absent)."""
         input_str = input_str.strip()
         if format_type == 'hex':
-            return cls.hex_to_rgb(input_str)
+            return cls.hex_to_rgba(input_str)
         elif format_type == 'rgb':
-            return cls._parse_rgb(input_str)
-        elif format_type == 'cmyk':
-            return cls._parse_cmyk(input_str)
-        elif format_type == 'hsl':
-            return cls._parse_hsl(input_str)
-        elif format_type == 'hsv':
-            return cls._parse_hsv(input_str)
-        else:
-            raise ValueError(f"Format inconnu: {format_type}")
+            return cls._parse_rgba(input_str)
+        return (*cls.parse_input(input_str, format_type), 1.0)
 
     @staticmethod
     def _parse_rgb(input_str: str) -> Tuple[int, int, int]:
-        values = re.findall(r'\d+', input_str)
-        if len(values) != 3:
+        # L'alpha est refusé plutôt qu'ignoré : utiliser _parse_rgba
+        if len(re.findall(RE_FLOAT_NUMBER, input_str)) != 3:
             raise ValueError("Format RGB invalide. Utilisez: R, G, B")
-        r, g, b = map(int, values)
+        r, g, b, _ = ColorConverter._parse_rgba(input_str)
+        return (r, g, b)
+
+    @staticmethod
+    def _parse_rgba(input_str: str) -> Tuple[int, int, int, float]:
+        values = re.findall(RE_FLOAT_NUMBER, input_str)
+        if len(values) not in (3, 4):
+            raise ValueError("Format RGB invalide. Utilisez: R, G, B ou R, G, B, A")
+        try:
+            r, g, b = map(int, values[:3])
+            a = float(values[3]) if len(values) == 4 else 1.0
+        except ValueError as e:
+            raise ValueError("Format RGB invalide. Utilisez: R, G, B ou R, G, B, A") from e
         if not all(0 <= x <= 255 for x in (r, g, b)):
             raise ValueError("Les valeurs RGB doivent être entre 0 et 255")
-        return (r, g, b)
+        if not 0 <= a <= 1:
+            raise ValueError("La valeur alpha doit être entre 0 et 1")
+        return (r, g, b, a)
 
     @staticmethod
-    def _parse_cmyk(input_str: str) -> Tuple[int, int, int]:
+    def _parse_cmyk_values(input_str: str) -> Tuple[float, float, float, float]:
         values = re.findall(RE_FLOAT_NUMBER, input_str)
         if len(values) != 4:
             raise ValueError("Format CMJN invalide. Utilisez: C, M, J, N")
         c, m, y, k = map(float, values)
-        return ColorConverter.cmyk_to_rgb(c, m, y, k)
+        return (c, m, y, k)
 
     @staticmethod
-    def _parse_hsl(input_str: str) -> Tuple[int, int, int]:
+    def _parse_hsl_values(input_str: str) -> Tuple[float, float, float]:
         values = re.findall(RE_FLOAT_NUMBER, input_str)
         if len(values) != 3:
             raise ValueError("Format HSL invalide. Utilisez: H, S, L")
         h, s, l = map(float, values)
-        return ColorConverter.hsl_to_rgb(h, s, l)
+        return (h, s, l)
 
     @staticmethod
-    def _parse_hsv(input_str: str) -> Tuple[int, int, int]:
+    def _parse_hsv_values(input_str: str) -> Tuple[float, float, float]:
         values = re.findall(RE_FLOAT_NUMBER, input_str)
         if len(values) != 3:
             raise ValueError("Format HSV invalide. Utilisez: H, S, V")
         h, s, v = map(float, values)
-        return ColorConverter.hsv_to_rgb(h, s, v)
+        return (h, s, v)
 
 
 class ColorHarmony:
@@ -338,14 +444,74 @@ class ContrastChecker:
     @classmethod
     def contrast_ratio(cls, rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int]) -> float:
         """Calcule le ratio de contraste entre deux couleurs."""
-        lum1 = cls.get_luminance(*rgb1)
-        lum2 = cls.get_luminance(*rgb2)
+        return cls.ratio_from_luminance(cls.get_luminance(*rgb1), cls.get_luminance(*rgb2))
 
+    @staticmethod
+    def ratio_from_luminance(lum1: float, lum2: float) -> float:
+        """Calcule le ratio de contraste à partir de deux luminances relatives."""
         lighter = max(lum1, lum2)
         darker = min(lum1, lum2)
 
         return round((lighter + 0.05) / (darker + 0.05), 2)
 
+    @staticmethod
+    def composite(fg: Tuple[int, int, int, float],
+                  bg: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Compose une couleur translucide sur un fond opaque (opérateur « over »)."""
+        r, g, b, a = fg
+        return (
+            round(r * a + bg[0] * (1 - a)),
+            round(g * a + bg[1] * (1 - a)),
+            round(b * a + bg[2] * (1 - a))
+        )
+
+    @staticmethod
+    def composite_batch(foregrounds: Sequence[Tuple[int, int, int, float]],
+                        backgrounds: Sequence[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        """
+        Compose des couleurs translucides sur un ou plusieurs fonds en une passe.
+
+        Avec un seul fond, il est appliqué à toutes les couleurs ; sinon les
+        deux séquences sont appariées élément par élément.
+        """
+        if len(backgrounds) == 1:
+            br, bg_, bb = backgrounds[0]
+            return [(round(r * a + br * (1 - a)), round(g * a + bg_ * (1 - a)),
+                     round(b * a + bb * (1 - a))) for r, g, b, a in foregrounds]
+        if len(backgrounds) != len(foregrounds):
+            raise ValueError("Le nombre de fonds doit être 1 ou égal au nombre de couleurs")
+        return [(round(r * a + br * (1 - a)), round(g * a + bg_ * (1 - a)),
+                 round(b * a + bb * (1 - a)))
+                for (r, g, b, a), (br, bg_, bb) in zip(foregrounds, backgrounds)]
+
+    @classmethod
+    def composite_stack(cls, layers: Sequence[Tuple[int, int, int, float]],
+                        background: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Compose une pile de calques (du plus bas au plus haut) sur un fond opaque."""
+        r, g, b = float(background[0]), float(background[1]), float(background[2])
+        for lr, lg, lb, a in layers:
+            r = lr * a + r * (1 - a)
+            g = lg * a + g * (1 - a)
+            b = lb * a + b * (1 - a)
+        return (round(r), round(g), round(b))
+
+    @classmethod
+    def contrast_ratio_alpha(cls, fg: Tuple[int, int, int, float],
+                             bg: Tuple[int, int, int]) -> float:
+        """Calcule le ratio de contraste d'une couleur translucide sur son fond."""
+        return cls.contrast_ratio(cls.composite(fg, bg), bg)
+
+    @classmethod
+    def contrast_ratios_over(cls, foregrounds: Sequence[Tuple[int, int, int, float]],
+                             backgrounds: Sequence[Tuple[int, int, int]]) -> List[float]:
+        """Calcule en lot les ratios de contraste de couleurs translucides sur leurs fonds."""
+        composed = cls.composite_batch(foregrounds, backgrounds)
+        if len(backgrounds) == 1:
+            lum_bg = cls.get_luminance(*backgrounds[0])
+            return [cls.ratio_from_luminance(cls.get_luminance(*rgb), lum_bg) for rgb in composed]
+        return [cls.ratio_from_luminance(cls.get_luminance(*rgb), cls.get_luminance(*bg))
+                for rgb, bg in zip(composed, backgrounds)]
+
     @classmethod
     def wcag_rating(cls, ratio: float) -> Dict[str, bool]:
         """Retourne les niveaux WCAG atteints."""
@@ -356,3 +522,60 @@ class ContrastChecker:
             'AAA_large': ratio >= 4.5
         }
         return contrast_levels
+
+
+def _build_default_registry() -> FormatRegistry:
+    """Enregistre les formats intégrés et leurs conversions directes."""
+    registry = FormatRegistry()
+    cc = ColorConverter
+
+    registry.register(ColorFormat(
+        'hex', 'Hexadécimal', '#RRGGBB',
+        parser=lambda text: cc.rgb_to_hex(*cc.hex_to_rgb(text)),
+        formatter=str,
+        edges={'rgb': cc.hex_to_rgb}
+    ))
+    registry.register(ColorFormat(
+        'rgb', 'RGB', 'R, G, B (0-255)',
+        parser=cc._parse_rgb,  # pylint: disable=protected-access
+        formatter=lambda v: f"{v[0]}, {v[1]}, {v[2]}",
+        edges={
+            'hex': lambda v: cc.rgb_to_hex(*v),
+            'cmyk': lambda v: cc.rgb_to_cmyk(*v),
+            'hsl': lambda v: cc.rgb_to_hsl(*v),
+            'hsv': lambda v: cc.rgb_to_hsv(*v),
+        }
+    ))
+    registry.register(ColorFormat(
+        'cmyk', 'CMJN', 'C, M, J, N (0-100%)',
+        parser=cc._parse_cmyk_values,  # pylint: disable=protected-access
+        formatter=lambda v: f"{v[0]}%, {v[1]}%, {v[2]}%, {v[3]}%",
+        edges={
+            'rgb': lambda v: cc.cmyk_to_rgb(*v),
+            'hsl': lambda v: cc.cmyk_to_hsl(*v),
+            'hsv': lambda v: cc.cmyk_to_hsv(*v),
+        }
+    ))
+    registry.register(ColorFormat(
+        'hsl', 'HSL', 'H (0-360), S, L (0-100%)',
+        parser=cc._parse_hsl_values,  # pylint: disable=protected-access
+        formatter=lambda v: f"{v[0]}°, {v[1]}%, {v[2]}%",
+        edges={
+            'rgb': lambda v: cc.hsl_to_rgb(*v),
+            'hsv': lambda v: cc.hsl_to_hsv(*v),
+        }
+    ))
+    registry.register(ColorFormat(
+        'hsv', 'HSV', 'H (0-360), S, V (0-100%)',
+        parser=cc._parse_hsv_values,  # pylint: disable=protected-access
+        formatter=lambda v: f"{v[0]}°, {v[1]}%, {v[2]}%",
+        edges={
+            'rgb': lambda v: cc.hsv_to_rgb(*v),
+            'hsl': lambda v: cc.hsv_to_hsl(*v),
+        }
+    ))
+    return registry
+
+
+# Registre par défaut : les formats tiers s'y ajoutent via register()/add_edge()
+FORMAT_REGISTRY: FormatRegistry = _build_default_registry()
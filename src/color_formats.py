@@ -0,0 +1,127 @@
+"""
+Module de registre des formats de couleur.
+Chaque format déclare son parseur, son formateur et ses conversions directes
+(arêtes) ; les chemins de conversion sont résolus dans le graphe puis
+compilés une seule fois en fonctions fusionnées.
+"""
+
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Converter = Callable[[Any], Any]
+
+
+class ColorFormat:
+    """Description d'un format de couleur enregistrable."""
+
+    def __init__(self, name: str, label: str, hint: str,
+                 parser: Callable[[str], Any], formatter: Callable[[Any], str],
+                 edges: Optional[Dict[str, Converter]] = None) -> None:
+        self.name = name
+        self.label = label
+        self.hint = hint
+        self.parser = parser
+        self.formatter = formatter
+        self.edges: Dict[str, Converter] = dict(edges or {})
+
+
+class FormatRegistry:
+    """Registre des formats et graphe de conversion entre eux."""
+
+    def __init__(self) -> None:
+        self._formats: Dict[str, ColorFormat] = {}
+        self._compiled: Dict[Tuple[str, str], Converter] = {}
+
+    def register(self, color_format: ColorFormat) -> None:
+        """Enregistre (ou remplace) un format."""
+        self._formats[color_format.name] = color_format
+        self._compiled.clear()
+
+    def add_edge(self, source: str, target: str, converter: Converter) -> None:
+        """Ajoute une conversion directe entre deux formats enregistrés."""
+        self.get(source).edges[target] = converter
+        self._compiled.clear()
+
+    def get(self, name: str) -> ColorFormat:
+        """Retourne un format par son nom."""
+        try:
+            return self._formats[name]
+        except KeyError:
+            raise ValueError(f"Format inconnu: {name}") from None
+
+    def names(self) -> List[str]:
+        """Noms des formats dans l'ordre d'enregistrement."""
+        return list(self._formats)
+
+    def labels(self) -> Dict[str, Tuple[str, str]]:
+        """Libellé et aide de saisie de chaque format."""
+        return {name: (fmt.label, fmt.hint) for name, fmt in self._formats.items()}
+
+    def find_path(self, source: str, target: str) -> List[str]:
+        """Plus court chemin de conversion (en nombre d'arêtes) entre deux formats."""
+        self.get(source)
+        self.get(target)
+        previous: Dict[str, Optional[str]] = {source: None}
+        pending = deque([source])
+
+        while pending:
+            current = pending.popleft()
+            if current == target:
+                path = [current]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])  # type: ignore[arg-type]
+                return path[::-1]
+            for neighbour in self._formats[current].edges:
+                if neighbour in self._formats and neighbour not in previous:
+                    previous[neighbour] = current
+                    pending.append(neighbour)
+
+        raise ValueError(f"Aucune conversion de {source} vers {target}")
+
+    def has_path(self, source: str, target: str) -> bool:
+        """Indique si une conversion existe entre deux formats enregistrés."""
+        try:
+            self.find_path(source, target)
+        except ValueError:
+            return False
+        return True
+
+    def converter(self, source: str, target: str) -> Converter:
+        """Retourne la fonction de conversion fusionnée (compilée une seule fois)."""
+        key = (source, target)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compile(self.find_path(source, target))
+            self._compiled[key] = compiled
+        return compiled
+
+    def _compile(self, path: List[str]) -> Converter:
+        """Compose les arêtes d'un chemin en une seule fonction."""
+        steps = [self._formats[a].edges[b] for a, b in zip(path, path[1:])]
+        if not steps:
+            return lambda values: values
+        if len(steps) == 1:
+            return steps[0]
+
+        def fused(values: Any) -> Any:
+            for step in steps:
+                values = step(values)
+            return values
+        return fused
+
+    def convert(self, values: Any, source: str, target: str) -> Any:
+        """Convertit des valeurs d'un format vers un autre."""
+        return self.converter(source, target)(values)
+
+    def parse(self, input_str: str, format_type: str, target: Optional[str] = None) -> Any:
+        """Parse une entrée dans son format, puis la convertit éventuellement."""
+        values = self.get(format_type).parser(input_str)
+        if target is None or target == format_type:
+            return values
+        return self.convert(values, format_type, target)
+
+    def format(self, values: Any, format_type: str, source: Optional[str] = None) -> str:
+        """Formate des valeurs pour l'affichage, après conversion depuis source."""
+        if source is not None and source != format_type:
+            values = self.convert(values, source, format_type)
+        return self.get(format_type).formatter(values)
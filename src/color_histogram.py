@@ -0,0 +1,236 @@
+"""
+Module d'analyse des couleurs d'une image : couleurs distinctes et histogrammes.
+Les couleurs sont marquées dans un bitmap de 2^24 bits (2 Mo) indexé par la
+valeur RGB compactée sur 24 bits, avec comptage optionnel des pixels.
+"""
+
+import argparse
+import heapq
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.color_converter import ColorConverter
+
+RGB_SPACE_SIZE = 1 << 24
+BITMAP_SIZE = RGB_SPACE_SIZE // 8
+
+COUNT_MODES = (None, 'sparse')
+
+# Nombre de bits à 1 de chaque octet (repli si int.bit_count est indisponible)
+_POPCOUNT: List[int] = [bin(value).count('1') for value in range(256)]
+
+PixelData = Union[bytes, bytearray, memoryview]
+
+
+def pack_rgb(r: int, g: int, b: int) -> int:
+    """Compacte une couleur RGB sur 24 bits."""
+    return (r << 16) | (g << 8) | b
+
+
+def unpack_rgb(value: int) -> Tuple[int, int, int]:
+    """Décompacte une valeur RGB 24 bits."""
+    return (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+
+
+def _packed_view(data: PixelData, channels: int) -> memoryview:
+    """
+    Réorganise les pixels en entiers 32 bits valant r << 16 | g << 8 | b.
+
+    Les copies se font par affectations de tranches (en C), sans boucle Python.
+    """
+    source = memoryview(data).cast('B')
+    pixels = len(source) // channels
+    source = source[:pixels * channels]
+    packed = bytearray(pixels * 4)
+
+    # Ordre des octets tel que la lecture native en 'I' donne r << 16 | g << 8 | b
+    if sys.byteorder == 'little':
+        packed[0::4] = source[2::channels]
+        packed[1::4] = source[1::channels]
+        packed[2::4] = source[0::channels]
+    else:
+        packed[1::4] = source[0::channels]
+        packed[2::4] = source[1::channels]
+        packed[3::4] = source[2::channels]
+    return memoryview(packed).cast('I')
+
+
+def _analyze_tile(data: PixelData, channels: int, count: bool) -> Tuple[bytes, Dict[int, int]]:
+    """Analyse une tuile : bitmap des couleurs présentes et comptage creux éventuel."""
+    packed = _packed_view(data, channels)
+    counts: Dict[int, int] = Counter(packed) if count else {}
+    present = counts.keys() if count else set(packed)
+
+    bitmap = bytearray(BITMAP_SIZE)
+    for value in present:
+        bitmap[value >> 3] |= 1 << (value & 7)
+    return bytes(bitmap), counts
+
+
+class ColorHistogram:
+    """Ensemble des couleurs d'une image (bitmap 24 bits) avec comptage optionnel."""
+
+    def __init__(self, count_mode: Optional[str] = 'sparse') -> None:
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Mode de comptage inconnu: {count_mode}")
+        self.count_mode = count_mode
+        self.bitmap = bytearray(BITMAP_SIZE)
+        self.counts: Optional[Counter] = Counter() if count_mode == 'sparse' else None
+        self.pixel_count = 0
+
+    def add_pixels(self, data: PixelData, channels: int = 3) -> None:
+        """Ajoute une tuile de pixels entrelacés (RGB ou RGBA, 8 bits)."""
+        bitmap, counts = _analyze_tile(data, channels, self.counts is not None)
+        self._merge_tile(bitmap, counts, len(memoryview(data).cast('B')) // channels)
+
+    def _merge_tile(self, bitmap: bytes, counts: Dict[int, int], pixels: int) -> None:
+        """Fusionne le résultat d'une tuile."""
+        merged = int.from_bytes(self.bitmap, 'little') | int.from_bytes(bitmap, 'little')
+        self.bitmap = bytearray(merged.to_bytes(BITMAP_SIZE, 'little'))
+        self.pixel_count += pixels
+
+        if self.counts is not None:
+            self.counts.update(counts)
+
+    def merge(self, other: "ColorHistogram") -> None:
+        """Fusionne un autre histogramme (ex. calculé sur d'autres tuiles)."""
+        self._merge_tile(bytes(other.bitmap), other.counts or {}, other.pixel_count)
+
+    def __contains__(self, rgb: Tuple[int, int, int]) -> bool:
+        value = pack_rgb(*rgb)
+        return bool(self.bitmap[value >> 3] & (1 << (value & 7)))
+
+    def unique_count(self) -> int:
+        """Nombre de couleurs distinctes."""
+        bitmap = int.from_bytes(self.bitmap, 'little')
+        if hasattr(bitmap, 'bit_count'):
+            return bitmap.bit_count()
+        # Python < 3.10
+        return sum(map(_POPCOUNT.__getitem__, self.bitmap))
+
+    def packed_colors(self) -> Iterator[int]:
+        """Parcourt les couleurs présentes (valeurs compactées, ordre croissant)."""
+        for index, byte in enumerate(self.bitmap):
+            if byte:
+                base = index << 3
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield base | bit
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """Parcourt les couples (couleur compactée, nombre de pixels)."""
+        if self.counts is None:
+            raise ValueError("Histogramme créé sans comptage")
+        return iter(self.counts.items())
+
+    def top_colors(self, k: int = 10) -> List[Dict[str, Any]]:
+        """Retourne les k couleurs les plus fréquentes avec les données de convert_all."""
+        top = heapq.nlargest(k, self.items(), key=lambda item: item[1])
+        results: List[Dict[str, Any]] = []
+        for value, count in top:
+            rgb = unpack_rgb(value)
+            results.append({
+                'count': count,
+                'share': count / self.pixel_count if self.pixel_count else 0.0,
+                **ColorConverter.convert_all(*rgb)
+            })
+        return results
+
+    def hsv_histogram(self, h_bins: int = 12, s_bins: int = 4,
+                      v_bins: int = 4) -> Dict[Tuple[int, int, int], int]:
+        """
+        Histogramme HSV par classes (teinte, saturation, valeur).
+
+        Chaque couleur distincte n'est convertie qu'une fois ; elle est pondérée
+        par son nombre de pixels si l'histogramme compte les pixels.
+        """
+        if self.counts is not None:
+            weighted: Iterator[Tuple[int, int]] = self.items()
+        else:
+            weighted = ((value, 1) for value in self.packed_colors())
+
+        histogram: Counter = Counter()
+        for value, count in weighted:
+            h, s, v = ColorConverter.rgb_to_hsv(*unpack_rgb(value))
+            key = (min(int(h / 360 * h_bins), h_bins - 1),
+                   min(int(s / 100 * s_bins), s_bins - 1),
+                   min(int(v / 100 * v_bins), v_bins - 1))
+            histogram[key] += count
+        return dict(histogram)
+
+
+def analyze_pixels(data: PixelData, channels: int = 3, count_mode: Optional[str] = 'sparse',
+                   tile_pixels: int = 1 << 20, workers: Optional[int] = None) -> ColorHistogram:
+    """
+    Analyse un tampon de pixels par tuiles réparties sur un pool de processus.
+
+    Chaque processus retourne le bitmap et le comptage de sa tuile ; les
+    résultats sont fusionnés par OU binaire et addition des compteurs.
+    """
+    histogram = ColorHistogram(count_mode)
+    source = memoryview(data).cast('B')
+    tile_size = tile_pixels * channels
+    count = count_mode is not None
+
+    if len(source) <= tile_size or workers == 1:
+        for start in range(0, len(source), tile_size):
+            histogram.add_pixels(source[start:start + tile_size], channels)
+        return histogram
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(executor.submit(_analyze_tile, bytes(source[start:start + tile_size]),
+                                    channels, count),
+                    len(source[start:start + tile_size]) // channels)
+                   for start in range(0, len(source), tile_size)]
+        for future, pixels in futures:
+            bitmap, counts = future.result()
+            histogram._merge_tile(bitmap, counts, pixels)  # pylint: disable=protected-access
+    return histogram
+
+
+def read_ppm(path: str) -> Tuple[int, int, bytes]:
+    """Lit une image PPM binaire (P6, 8 bits) et retourne largeur, hauteur et pixels RGB."""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    fields: List[bytes] = []
+    position = 0
+    while len(fields) < 4:
+        # Sauter blancs et commentaires de l'en-tête
+        while data[position:position + 1].isspace():
+            position += 1
+        if data[position:position + 1] == b'#':
+            position = data.index(b'\n', position) + 1
+            continue
+        end = position
+        while end < len(data) and not data[end:end + 1].isspace():
+            end += 1
+        fields.append(data[position:end])
+        position = end
+
+    magic, width, height, maxval = fields[0], int(fields[1]), int(fields[2]), int(fields[3])
+    if magic != b'P6' or maxval != 255:
+        raise ValueError("Seules les images PPM binaires (P6) 8 bits sont supportées")
+    start = position + 1
+    return width, height, data[start:start + width * height * 3]
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description='Couleurs distinctes et histogramme d\'une image')
+    parser.add_argument('image', help='Image PPM (P6)')
+    parser.add_argument('--top', type=int, default=10, help='Nombre de couleurs fréquentes')
+    parser.add_argument('--workers', type=int, default=None, help='Nombre de processus')
+    args = parser.parse_args()
+
+    width, height, pixels = read_ppm(args.image)
+    histogram = analyze_pixels(pixels, 3, 'sparse', workers=args.workers)
+    print(f"{width}x{height} : {histogram.unique_count()} couleurs distinctes")
+    for entry in histogram.top_colors(args.top):
+        print(f"  {entry['hex']}  {entry['count']} px ({entry['share']:.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Module de conversion haute précision.
+Les canaux sont des flottants normalisés (0-1) sans arrondi intermédiaire ;
+l'arrondi n'est appliqué qu'à la présentation (8 ou 16 bits).
+"""
+
+import argparse
+import time
+from array import array
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from src.color_converter import ColorConverter
+
+# Tampons acceptés : array, bytes, memoryview ou tout objet exposant le buffer protocol
+Buffer = Union[array, bytes, bytearray, memoryview]
+
+# Échelle de normalisation selon le type des canaux entiers
+CHANNEL_SCALES: Dict[str, float] = {'B': 255.0, 'H': 65535.0}
+
+# Référence D65 pour la conversion XYZ -> Lab
+D65_WHITE: Tuple[float, float, float] = (0.95047, 1.0, 1.08883)
+
+
+class PrecisionConverter:
+    """Conversions sur canaux flottants normalisés, sans quantification intermédiaire."""
+
+    @staticmethod
+    def from_8bit(r: int, g: int, b: int) -> Tuple[float, float, float]:
+        """Normalise un RGB 8 bits en flottants 0-1."""
+        return (r / 255.0, g / 255.0, b / 255.0)
+
+    @staticmethod
+    def from_16bit(r: int, g: int, b: int) -> Tuple[float, float, float]:
+        """Normalise un RGB 16 bits en flottants 0-1."""
+        return (r / 65535.0, g / 65535.0, b / 65535.0)
+
+    @staticmethod
+    def to_8bit(r: float, g: float, b: float) -> Tuple[int, int, int]:
+        """Arrondi de présentation en RGB 8 bits."""
+        return (
+            max(0, min(255, round(r * 255))),
+            max(0, min(255, round(g * 255))),
+            max(0, min(255, round(b * 255)))
+        )
+
+    @staticmethod
+    def to_16bit(r: float, g: float, b: float) -> Tuple[int, int, int]:
+        """Arrondi de présentation en RGB 16 bits."""
+        return (
+            max(0, min(65535, round(r * 65535))),
+            max(0, min(65535, round(g * 65535))),
+            max(0, min(65535, round(b * 65535)))
+        )
+
+    @staticmethod
+    def _hue(r: float, g: float, b: float, max_c: float, delta: float) -> float:
+        """Calcule la teinte (degrés) commune à HSL et HSV."""
+        if delta == 0:
+            return 0.0
+        if max_c == r:
+            return 60 * (((g - b) / delta) % 6)
+        if max_c == g:
+            return 60 * (((b - r) / delta) + 2)
+        return 60 * (((r - g) / delta) + 4)
+
+    @staticmethod
+    def _from_hue(h: float, c: float, m: float) -> Tuple[float, float, float]:
+        """Reconstruit RGB à partir de la teinte, de la chroma et du décalage."""
+        h = h % 360
+        x = c * (1 - abs((h / 60) % 2 - 1))
+
+        if h < 60:
+            r_prime, g_prime, b_prime = c, x, 0.0
+        elif h < 120:
+            r_prime, g_prime, b_prime = x, c, 0.0
+        elif h < 180:
+            r_prime, g_prime, b_prime = 0.0, c, x
+        elif h < 240:
+            r_prime, g_prime, b_prime = 0.0, x, c
+        elif h < 300:
+            r_prime, g_prime, b_prime = x, 0.0, c
+        else:
+            r_prime, g_prime, b_prime = c, 0.0, x
+
+        return (r_prime + m, g_prime + m, b_prime + m)
+
+    @classmethod
+    def rgb_to_hsl(cls, r: float, g: float, b: float) -> Tuple[float, float, float]:
+        """
+        Convertit RGB (0-1) en HSL (degrés, %, %) sans arrondi.
+
+        Les canaux hors gamut (ex. issus de lab_to_rgb) sont ramenés dans 0-1 :
+        la saturation n'est pas définie au-delà et son dénominateur s'y annule.
+        """
+        r, g, b = max(0.0, min(1.0, r)), max(0.0, min(1.0, g)), max(0.0, min(1.0, b))
+        max_c = max(r, g, b)
+        min_c = min(r, g, b)
+        delta = max_c - min_c
+        l = (max_c + min_c) / 2
+        s = 0.0 if delta == 0 else delta / (1 - abs(2 * l - 1))
+        return (cls._hue(r, g, b, max_c, delta), s * 100, l * 100)
+
+    @classmethod
+    def hsl_to_rgb(cls, h: float, s: float, l: float) -> Tuple[float, float, float]:
+        """Convertit HSL (degrés, %, %) en RGB (0-1) sans arrondi."""
+        s = s / 100.0
+        l = l / 100.0
+        c = (1 - abs(2 * l - 1)) * s
+        return cls._from_hue(h, c, l - c / 2)
+
+    @classmethod
+    def rgb_to_hsv(cls, r: float, g: float, b: float) -> Tuple[float, float, float]:
+        """Convertit RGB (0-1) en HSV (degrés, %, %) sans arrondi."""
+        max_c = max(r, g, b)
+        delta = max_c - min(r, g, b)
+        s = 0.0 if max_c == 0 else delta / max_c
+        return (cls._hue(r, g, b, max_c, delta), s * 100, max_c * 100)
+
+    @classmethod
+    def hsv_to_rgb(cls, h: float, s: float, v: float) -> Tuple[float, float, float]:
+        """Convertit HSV (degrés, %, %) en RGB (0-1) sans arrondi."""
+        s = s / 100.0
+        v = v / 100.0
+        c = v * s
+        return cls._from_hue(h, c, v - c)
+
+    @staticmethod
+    def rgb_to_cmyk(r: float, g: float, b: float) -> Tuple[float, float, float, float]:
+        """Convertit RGB (0-1) en CMJN (%) sans arrondi."""
+        k = 1 - max(r, g, b)
+        if k >= 1:
+            return (0.0, 0.0, 0.0, 100.0)
+        return (
+            (1 - r - k) / (1 - k) * 100,
+            (1 - g - k) / (1 - k) * 100,
+            (1 - b - k) / (1 - k) * 100,
+            k * 100
+        )
+
+    @staticmethod
+    def cmyk_to_rgb(c: float, m: float, y: float, k: float) -> Tuple[float, float, float]:
+        """Convertit CMJN (%) en RGB (0-1) sans arrondi."""
+        k = 1 - k / 100.0
+        return ((1 - c / 100.0) * k, (1 - m / 100.0) * k, (1 - y / 100.0) * k)
+
+    @staticmethod
+    def rgb_to_lab(r: float, g: float, b: float) -> Tuple[float, float, float]:
+        """Convertit RGB sRGB (0-1) en CIE Lab (D65) sans arrondi."""
+        def linear(c: float) -> float:
+            return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+        def f(t: float) -> float:
+            return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+
+        rl, gl, bl = linear(r), linear(g), linear(b)
+        x = (0.4124564 * rl + 0.3575761 * gl + 0.1804375 * bl) / D65_WHITE[0]
+        y = (0.2126729 * rl + 0.7151522 * gl + 0.0721750 * bl) / D65_WHITE[1]
+        z = (0.0193339 * rl + 0.1191920 * gl + 0.9503041 * bl) / D65_WHITE[2]
+
+        fx, fy, fz = f(x), f(y), f(z)
+        return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+    @staticmethod
+    def lab_to_rgb(l: float, a: float, b: float) -> Tuple[float, float, float]:
+        """Convertit CIE Lab (D65) en RGB sRGB (0-1, non borné) sans arrondi."""
+        def f_inv(t: float) -> float:
+            return t ** 3 if t > 6 / 29 else (116 * t - 16) * 27 / 24389
+
+        def gamma(c: float) -> float:
+            return c * 12.92 if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+
+        fy = (l + 16) / 116
+        x = f_inv(fy + a / 500) * D65_WHITE[0]
+        y = f_inv(fy) * D65_WHITE[1]
+        z = f_inv(fy - b / 200) * D65_WHITE[2]
+
+        rl = 3.2404542 * x - 1.5371385 * y - 0.4985314 * z
+        gl = -0.9692660 * x + 1.8760108 * y + 0.0415560 * z
+        bl = 0.0556434 * x - 0.2040259 * y + 1.0572252 * z
+        return (gamma(max(0.0, rl)), gamma(max(0.0, gl)), gamma(max(0.0, bl)))
+
+    # --- Traitement par tampons ---
+
+    @staticmethod
+    def to_float_buffer(data: Buffer, typecode: str = 'd') -> array:
+        """
+        Convertit un tampon de canaux entiers (8 ou 16 bits) en flottants normalisés.
+
+        Le tampon flottant retourné est contigu ('d' = float64, 'f' = float32).
+        Un tampon déjà flottant est simplement recopié dans le type demandé.
+        """
+        view = memoryview(data)
+        if view.format in CHANNEL_SCALES:
+            scale = 1.0 / CHANNEL_SCALES[view.format]
+            return array(typecode, [value * scale for value in view])
+        return array(typecode, view)
+
+    @staticmethod
+    def quantize(data: Buffer, bits: int = 8) -> array:
+        """Arrondi de présentation d'un tampon flottant normalisé en canaux 8 ou 16 bits."""
+        if bits not in (8, 16):
+            raise ValueError("La profondeur doit être 8 ou 16 bits")
+        typecode = 'B' if bits == 8 else 'H'
+        top = CHANNEL_SCALES[typecode]
+        return array(typecode, [max(0, min(int(top), round(value * top)))
+                                for value in memoryview(data)])
+
+    @classmethod
+    def convert_buffer(cls, data: Buffer, conversion: str, typecode: str = 'd',
+                       stride: Optional[int] = None) -> array:
+        """
+        Applique une conversion à un tampon de canaux entrelacés.
+
+        conversion est le nom d'une méthode (ex. 'rgb_to_hsl'). Les entrées RGB
+        entières (8/16 bits) sont normalisées ; la sortie est un tampon flottant
+        contigu, sans arrondi. stride permet de sauter des canaux supplémentaires
+        (ex. 4 pour des lignes RGBA dont l'alpha est ignoré).
+        """
+        func: Callable[..., Tuple[float, ...]] = getattr(cls, conversion)
+        in_channels = 4 if conversion.startswith('cmyk') else 3
+        stride = stride or in_channels
+        view = memoryview(data)
+        end = len(view) - stride + 1
+        output = array(typecode)
+
+        # Parcours direct de la vue par pas de stride : aucune copie intermédiaire
+        if view.format in CHANNEL_SCALES and conversion.startswith('rgb'):
+            scale = 1.0 / CHANNEL_SCALES[view.format]
+            for i in range(0, end, stride):
+                output.extend(func(view[i] * scale, view[i + 1] * scale, view[i + 2] * scale))
+        else:
+            for i in range(0, end, stride):
+                output.extend(func(*view[i:i + in_channels]))
+        return output
+
+
+def benchmark(count: int = 100_000) -> Dict[str, Any]:
+    """
+    Compare la chaîne CMJN -> RGB -> HSL actuelle (arrondie) et le mode précis.
+
+    L'erreur est mesurée par rapport au calcul précis en float64 : écart
+    maximal et moyen sur la saturation et la luminosité (en %).
+    """
+    samples = [((i * 37) % 101, (i * 53) % 101, (i * 71) % 101, (i * 11) % 60)
+               for i in range(count)]
+
+    started = time.perf_counter()
+    rounded = [ColorConverter.rgb_to_hsl(*ColorConverter.cmyk_to_rgb(*cmyk)) for cmyk in samples]
+    rounded_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    precise = [PrecisionConverter.rgb_to_hsl(*PrecisionConverter.cmyk_to_rgb(*cmyk))
+               for cmyk in samples]
+    precise_time = time.perf_counter() - started
+
+    errors = [max(abs(a[1] - p[1]), abs(a[2] - p[2])) for a, p in zip(rounded, precise)]
+    return {
+        'count': count,
+        'rounded_us_per_value': rounded_time / count * 1e6,
+        'precise_us_per_value': precise_time / count * 1e6,
+        'rounded_max_error': max(errors),
+        'rounded_mean_error': sum(errors) / count,
+    }
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande : rapport vitesse/précision."""
+    parser = argparse.ArgumentParser(description='Comparaison du mode haute précision')
+    parser.add_argument('--count', type=int, default=100_000, help='Nombre d\'échantillons')
+    args = parser.parse_args()
+
+    report = benchmark(args.count)
+    print(f"Échantillons: {report['count']}")
+    print(f"Chemin actuel : {report['rounded_us_per_value']:.2f} µs/valeur, "
+          f"erreur max {report['rounded_max_error']:.2f}%, "
+          f"moyenne {report['rounded_mean_error']:.3f}%")
+    print(f"Mode précis   : {report['precise_us_per_value']:.2f} µs/valeur, erreur 0 (référence)")
+
+
+if __name__ == "__main__":
+    main()
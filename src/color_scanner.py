@@ -0,0 +1,181 @@
+"""
+Module d'inventaire des couleurs d'une arborescence de sources.
+Extrait les littéraux HEX, rgb() et hsl() des fichiers CSS/SCSS/JSON.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.color_converter import ColorConverter
+
+DEFAULT_EXTENSIONS: Tuple[str, ...] = ('.css', '.scss', '.sass', '.less', '.json')
+DEFAULT_EXCLUDED_DIRS: Tuple[str, ...] = ('.git', 'node_modules')
+
+# Automate unique : un groupe nommé par format reconnu par ColorConverter.parse_input.
+# Un « hex » suivi d'une accolade ouvrante avant tout ';' ou '}' est un sélecteur
+# d'identifiant (#add, #fade:hover {…}), pas une valeur : il est écarté, sauf
+# s'il est fermé par un guillemet (valeur de chaîne JSON).
+RE_COLOR_LITERAL = re.compile(
+    rb'(?P<hex>#(?:[0-9A-Fa-f]{8}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{3,4})(?![0-9A-Za-z_-])'
+    rb'(?=["\']|(?![^;{}]{0,256}\{)))'
+    rb'|(?P<rgb>\brgba?\(\s*\d{1,3}\s*[,\s]\s*\d{1,3}\s*[,\s]\s*\d{1,3}'
+    rb'(?:\s*[,/]\s*[\d.]+)?\s*\))'
+    rb'|(?P<hsl>\bhsl\(\s*[\d.]+(?:deg)?\s*[,\s]\s*[\d.]+%?\s*[,\s]\s*[\d.]+%?\s*\))',
+    re.IGNORECASE
+)
+
+# (format, littéral, chemin, ligne, colonne)
+Occurrence = Tuple[str, str, str, int, int]
+
+
+def _iter_files(root: str, extensions: Sequence[str],
+                excluded_dirs: Sequence[str]) -> Iterator[str]:
+    """Parcourt l'arborescence et retourne les fichiers à analyser."""
+    suffixes = tuple(ext.lower() for ext in extensions)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
+        for filename in filenames:
+            if filename.lower().endswith(suffixes):
+                yield os.path.join(dirpath, filename)
+
+
+def scan_file(path: str) -> List[Occurrence]:
+    """Extrait les littéraux de couleur d'un fichier mappé en mémoire."""
+    occurrences: List[Occurrence] = []
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return occurrences
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # Numéro de ligne calculé de façon incrémentale entre deux correspondances
+                line = 1
+                line_start = 0
+                last_pos = 0
+                for match in RE_COLOR_LITERAL.finditer(data):  # type: ignore[arg-type]
+                    start = match.start()
+                    newlines = data[last_pos:start].count(b'\n')
+                    if newlines:
+                        line += newlines
+                        line_start = data.rfind(b'\n', last_pos, start) + 1
+                    last_pos = start
+                    literal = match.group(0).decode('ascii')
+                    occurrences.append((match.lastgroup or 'hex', literal, path,
+                                        line, start - line_start + 1))
+    except OSError:
+        pass
+    return occurrences
+
+
+def _scan_many(paths: List[str]) -> List[Occurrence]:
+    """Analyse un paquet de fichiers (unité de travail du pool)."""
+    occurrences: List[Occurrence] = []
+    for path in paths:
+        occurrences.extend(scan_file(path))
+    return occurrences
+
+
+def _chunks(paths: Iterator[str], size: int) -> Iterator[List[str]]:
+    """Découpe la liste des fichiers en paquets."""
+    chunk: List[str] = []
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def scan_tree(root: str, extensions: Sequence[str] = DEFAULT_EXTENSIONS,
+              excluded_dirs: Sequence[str] = DEFAULT_EXCLUDED_DIRS,
+              workers: Optional[int] = None, use_processes: bool = True,
+              chunk_size: int = 256) -> Dict[str, Dict[str, Any]]:
+    """
+    Construit l'inventaire dédupliqué des couleurs d'une arborescence.
+
+    Retourne un dictionnaire indexé par couleur hexadécimale normalisée
+    (#RRGGBBAA pour les couleurs translucides), contenant les données de
+    convert_all (ou convert_all_rgba) et la liste des occurrences.
+    """
+    executor: Executor
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    inventory: Dict[str, Dict[str, Any]] = {}
+    # Un même littéral n'est analysé qu'une seule fois
+    parsed: Dict[Tuple[str, str], Optional[str]] = {}
+
+    with executor:
+        batches = executor.map(_scan_many, _chunks(_iter_files(root, extensions, excluded_dirs),
+                                                   chunk_size))
+        for occurrences in batches:
+            for fmt, literal, path, line, column in occurrences:
+                key = (fmt, literal.lower())
+                if key not in parsed:
+                    try:
+                        r, g, b, a = ColorConverter.parse_input_rgba(literal, fmt)
+                    except ValueError:
+                        parsed[key] = None
+                        continue
+                    # Les couleurs translucides ont leur propre entrée #RRGGBBAA
+                    if a < 1:
+                        hex_color = ColorConverter.rgba_to_hex(r, g, b, a)
+                    else:
+                        hex_color = ColorConverter.rgb_to_hex(r, g, b)
+                    parsed[key] = hex_color
+                    if hex_color not in inventory:
+                        inventory[hex_color] = {
+                            'data': (ColorConverter.convert_all_rgba(r, g, b, a) if a < 1
+                                     else ColorConverter.convert_all(r, g, b)),
+                            'occurrences': []
+                        }
+                hex_color = parsed[key]
+                if hex_color is None:
+                    continue
+                inventory[hex_color]['occurrences'].append({
+                    'path': path,
+                    'line': line,
+                    'column': column,
+                    'literal': literal
+                })
+
+    return inventory
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse les arguments de ligne de commande."""
+    parser = argparse.ArgumentParser(description='Inventaire des couleurs d\'une arborescence')
+    parser.add_argument('root', help='Dossier à analyser')
+    parser.add_argument('--ext', nargs='+', default=list(DEFAULT_EXTENSIONS),
+                        help='Extensions de fichiers à analyser')
+    parser.add_argument('--workers', type=int, default=None, help='Nombre de workers')
+    parser.add_argument('--threads', action='store_true',
+                        help='Utiliser des threads plutôt que des processus')
+    parser.add_argument('--output', default=None, help='Fichier JSON de sortie')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande."""
+    args = _parse_args()
+    inventory = scan_tree(args.root, extensions=args.ext, workers=args.workers,
+                          use_processes=not args.threads)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(inventory, f, ensure_ascii=False, indent=2)
+    else:
+        for hex_color, entry in sorted(inventory.items(),
+                                       key=lambda item: -len(item[1]['occurrences'])):
+            print(f"{hex_color}  {len(entry['occurrences'])} occurrence(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Module de conversion asynchrone de flux de couleurs.
+Regroupe les entrées en micro-lots (taille ou délai) et les convertit
+en un seul appel exécuteur par lot.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+from src.color_converter import ColorConverter
+
+
+class StreamResult(NamedTuple):
+    """Résultat de conversion d'une entrée du flux."""
+    raw: str
+    rgb: Optional[Tuple[int, int, int]]
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+
+_END_OF_STREAM = object()
+
+
+def convert_batch(inputs: List[str], format_type: str) -> List[StreamResult]:
+    """Convertit un lot d'entrées ; les erreurs sont rapportées par entrée."""
+    results: List[StreamResult] = []
+    parse = ColorConverter.parse_input
+    convert = ColorConverter.convert_all
+    for raw in inputs:
+        try:
+            rgb = parse(raw, format_type)
+            results.append(StreamResult(raw, rgb, convert(*rgb), None))
+        except ValueError as e:
+            results.append(StreamResult(raw, None, None, str(e)))
+    return results
+
+
+async def _fill_queue(source: AsyncIterable[str], queue: "asyncio.Queue[Any]") -> None:
+    """Recopie le flux source dans la file (bloque quand elle est pleine)."""
+    try:
+        async for raw in source:
+            await queue.put(raw)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Débloquer le consommateur avant de propager l'erreur
+        await queue.put(_END_OF_STREAM)
+        raise
+    await queue.put(_END_OF_STREAM)
+
+
+async def _next_batch(queue: "asyncio.Queue[Any]", batch_size: int,
+                      max_delay: float) -> Tuple[List[str], bool]:
+    """Collecte un lot jusqu'à batch_size entrées ou max_delay secondes."""
+    loop = asyncio.get_running_loop()
+    batch: List[str] = []
+
+    # Le délai ne démarre qu'à la réception du premier élément du lot
+    item = await queue.get()
+    if item is _END_OF_STREAM:
+        return batch, True
+    batch.append(item)
+    deadline = loop.time() + max_delay
+
+    while len(batch) < batch_size:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            item = await asyncio.wait_for(queue.get(), remaining)
+        except asyncio.TimeoutError:
+            break
+        if item is _END_OF_STREAM:
+            return batch, True
+        batch.append(item)
+
+    return batch, False
+
+
+async def aconvert_stream(source: AsyncIterable[str], format_type: str,
+                          batch_size: int = 256, max_delay: float = 0.05,
+                          executor: Optional[Executor] = None) -> AsyncIterator[StreamResult]:
+    """
+    Convertit un flux asynchrone de chaînes de couleurs.
+
+    Les entrées sont regroupées par lots de batch_size éléments au plus, ou
+    après max_delay secondes. Chaque lot est converti en un seul appel dans
+    l'exécuteur. La file interne est bornée à un lot d'avance, ce qui
+    ralentit le producteur tant que le consommateur n'a pas lu les résultats.
+    """
+    if batch_size < 1:
+        raise ValueError("La taille de lot doit être au moins 1")
+
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=batch_size)
+    producer = asyncio.ensure_future(_fill_queue(source, queue))
+
+    try:
+        finished = False
+        while not finished:
+            batch, finished = await _next_batch(queue, batch_size, max_delay)
+            if not batch:
+                break
+            results = await loop.run_in_executor(executor, convert_batch, batch, format_type)
+            for result in results:
+                yield result
+
+        # Propager une éventuelle erreur du flux source
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
@@ -0,0 +1,347 @@
+"""
+Module d'audit incrémental du contraste WCAG des design tokens.
+Seules les paires touchées par une modification de tokens sont réévaluées.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from src.color_converter import ColorConverter, ContrastChecker
+
+RE_TOKEN_ALIAS = re.compile(r'^\{([^{}]+)\}$')
+
+Pair = Tuple[str, str]
+RGBA = Tuple[int, int, int, float]
+
+# Fond de page sur lequel sont composés les fonds translucides
+CANVAS_COLOR: Tuple[int, int, int] = (255, 255, 255)
+
+
+class PairResult(NamedTuple):
+    """Résultat de contraste d'une paire premier plan / fond."""
+    ratio: float
+    levels: Dict[str, bool]
+
+
+class AuditChange(NamedTuple):
+    """Changement de conformité d'une paire entre deux audits."""
+    foreground: str
+    background: str
+    before: Optional[PairResult]
+    after: Optional[PairResult]
+
+
+def flatten_tokens(data: Any, prefix: str = '') -> Dict[str, str]:
+    """Aplatit un fichier de tokens imbriqués en noms pointés."""
+    tokens: Dict[str, str] = {}
+    if not isinstance(data, dict):
+        return tokens
+
+    for key, value in data.items():
+        if key.startswith('$') and key != '$value':
+            continue
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            leaf = value.get('$value', value.get('value'))
+            if isinstance(leaf, str):
+                tokens[name] = leaf.strip()
+            else:
+                tokens.update(flatten_tokens(value, name))
+        elif isinstance(value, str):
+            tokens[name] = value.strip()
+    return tokens
+
+
+def _parse_color(value: str) -> Optional[RGBA]:
+    """Parse une valeur de token en RGBA, ou None si ce n'est pas une couleur."""
+    try:
+        return ColorConverter.parse_input_rgba(value, ColorConverter.detect_format(value))
+    except ValueError:
+        return None
+
+
+class ContrastAudit:
+    """Audit de contraste avec index de dépendances tokens -> paires."""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, str] = {}
+        self._file_tokens: Dict[str, Dict[str, str]] = {}
+        # Sources définissant chaque token, dans l'ordre de chargement
+        self._sources: Dict[str, List[str]] = {}
+        self._load_order: Dict[str, int] = {}
+        self._pairs_by_token: Dict[str, Set[Pair]] = {}
+        self._aliases_of: Dict[str, Set[str]] = {}
+        self._colors: Dict[str, Optional[RGBA]] = {}
+        self._luminance: Dict[str, Optional[float]] = {}
+        self.results: Dict[Pair, Optional[PairResult]] = {}
+
+    # --- Paires ---
+
+    def add_pair(self, foreground: str, background: str) -> Optional[AuditChange]:
+        """Ajoute une paire à auditer et l'évalue immédiatement."""
+        pair = (foreground, background)
+        if pair in self.results:
+            return None
+        self._pairs_by_token.setdefault(foreground, set()).add(pair)
+        self._pairs_by_token.setdefault(background, set()).add(pair)
+        after = self._evaluate(pair)
+        self.results[pair] = after
+        return AuditChange(foreground, background, None, after)
+
+    def remove_pair(self, foreground: str, background: str) -> None:
+        """Retire une paire de l'audit."""
+        pair = (foreground, background)
+        self.results.pop(pair, None)
+        for token in pair:
+            self._pairs_by_token.get(token, set()).discard(pair)
+
+    def load_pairs(self, path: str) -> List[AuditChange]:
+        """Charge les paires depuis un JSON ([fg, bg] ou {foreground, background})."""
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+
+        changes: List[AuditChange] = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                foreground, background = entry['foreground'], entry['background']
+            else:
+                foreground, background = entry
+            change = self.add_pair(foreground, background)
+            if change is not None:
+                changes.append(change)
+        return changes
+
+    # --- Tokens ---
+
+    def load_tokens(self, path: str) -> List[AuditChange]:
+        """(Re)charge un fichier de tokens et retourne les changements de conformité."""
+        with open(path, encoding='utf-8') as f:
+            new_tokens = flatten_tokens(json.load(f))
+        return self.update_tokens(path, new_tokens)
+
+    def update_tokens(self, source: str, new_tokens: Dict[str, str]) -> List[AuditChange]:
+        """
+        Applique les tokens d'une source et réévalue les paires concernées.
+
+        Un token défini par plusieurs sources prend la valeur de la dernière
+        chargée ; s'il disparaît de celle-ci, la précédente reprend la main.
+        """
+        self._load_order.setdefault(source, len(self._load_order))
+        old_tokens = self._file_tokens.get(source, {})
+        self._file_tokens[source] = dict(new_tokens)
+        changed: Set[str] = set()
+
+        for name in new_tokens.keys() - old_tokens.keys():
+            sources = self._sources.setdefault(name, [])
+            sources.append(source)
+            sources.sort(key=self._load_order.__getitem__)
+        for name in old_tokens.keys() - new_tokens.keys():
+            sources = self._sources[name]
+            sources.remove(source)
+            if not sources:
+                del self._sources[name]
+
+        for name in old_tokens.keys() | new_tokens.keys():
+            sources = self._sources.get(name)
+            value = self._file_tokens[sources[-1]][name] if sources else None
+            if value == self.values.get(name):
+                continue
+            if value is None:
+                self._remove_value(name)
+            else:
+                self._set_value(name, value)
+            changed.add(name)
+
+        return self._reevaluate(changed)
+
+    def _set_value(self, name: str, value: str) -> None:
+        """Enregistre la valeur d'un token et son éventuel alias."""
+        self._unlink_alias(name)
+        self.values[name] = value
+        alias = RE_TOKEN_ALIAS.match(value)
+        if alias:
+            self._aliases_of.setdefault(alias.group(1), set()).add(name)
+
+    def _remove_value(self, name: str) -> None:
+        """Supprime un token."""
+        self._unlink_alias(name)
+        self.values.pop(name, None)
+
+    def _unlink_alias(self, name: str) -> None:
+        """Retire le token de l'index inverse des alias."""
+        alias = RE_TOKEN_ALIAS.match(self.values.get(name, ''))
+        if alias:
+            self._aliases_of.get(alias.group(1), set()).discard(name)
+
+    def _dependents(self, tokens: Iterable[str]) -> Set[str]:
+        """Retourne les tokens modifiés et tous ceux qui y font référence."""
+        pending = list(tokens)
+        seen: Set[str] = set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            pending.extend(self._aliases_of.get(name, ()))
+        return seen
+
+    # --- Évaluation ---
+
+    def color(self, name: str, _visiting: Optional[Set[str]] = None) -> Optional[RGBA]:
+        """Retourne la couleur RGBA (mise en cache) d'un token, en suivant les alias."""
+        if name in self._colors:
+            return self._colors[name]
+
+        value = self.values.get(name)
+        rgba: Optional[RGBA] = None
+        if value is not None:
+            alias = RE_TOKEN_ALIAS.match(value)
+            if alias:
+                visiting = _visiting or set()
+                if name not in visiting:
+                    visiting.add(name)
+                    rgba = self.color(alias.group(1), visiting)
+            else:
+                rgba = _parse_color(value)
+
+        self._colors[name] = rgba
+        return rgba
+
+    def _opaque(self, name: str) -> Optional[Tuple[int, int, int]]:
+        """Couleur opaque d'un token, composée sur CANVAS_COLOR si translucide."""
+        rgba = self.color(name)
+        if rgba is None:
+            return None
+        if rgba[3] >= 1.0:
+            return (rgba[0], rgba[1], rgba[2])
+        return ContrastChecker.composite(rgba, CANVAS_COLOR)
+
+    def luminance(self, name: str) -> Optional[float]:
+        """Retourne la luminance (mise en cache) d'un token utilisé comme fond opaque."""
+        if name not in self._luminance:
+            rgb = self._opaque(name)
+            self._luminance[name] = None if rgb is None else ContrastChecker.get_luminance(*rgb)
+        return self._luminance[name]
+
+    def _evaluate(self, pair: Pair) -> Optional[PairResult]:
+        """
+        Évalue une paire à partir des couleurs et luminances en cache.
+
+        Un premier plan translucide est composé sur son fond avant le calcul
+        de luminance : son contraste dépend alors du fond de la paire.
+        """
+        foreground = self.color(pair[0])
+        lum_bg = self.luminance(pair[1])
+        if foreground is None or lum_bg is None:
+            return None
+        if foreground[3] >= 1.0:
+            lum_fg = self.luminance(pair[0])
+        else:
+            background = self._opaque(pair[1])
+            lum_fg = ContrastChecker.get_luminance(
+                *ContrastChecker.composite(foreground, background))
+        ratio = ContrastChecker.ratio_from_luminance(lum_fg, lum_bg)
+        return PairResult(ratio, ContrastChecker.wcag_rating(ratio))
+
+    def _reevaluate(self, changed: Set[str]) -> List[AuditChange]:
+        """Invalide les tokens modifiés et réévalue uniquement leurs paires."""
+        affected_tokens = self._dependents(changed)
+        affected_pairs: Set[Pair] = set()
+        for name in affected_tokens:
+            self._colors.pop(name, None)
+            self._luminance.pop(name, None)
+            affected_pairs.update(self._pairs_by_token.get(name, ()))
+
+        changes: List[AuditChange] = []
+        for pair in sorted(affected_pairs):
+            before = self.results.get(pair)
+            after = self._evaluate(pair)
+            self.results[pair] = after
+            if (before is None) != (after is None) or \
+                    (before is not None and after is not None and before.levels != after.levels):
+                changes.append(AuditChange(pair[0], pair[1], before, after))
+        return changes
+
+    def failing(self, level: str = 'AA_normal') -> List[Pair]:
+        """Retourne les paires qui n'atteignent pas le niveau WCAG demandé."""
+        return sorted(pair for pair, result in self.results.items()
+                      if result is None or not result.levels[level])
+
+    # --- Surveillance ---
+
+    def watch(self, paths: List[str], callback: Callable[[str, List[AuditChange]], None],
+              interval: float = 0.5, should_stop: Callable[[], bool] = lambda: False) -> None:
+        """Surveille les fichiers de tokens et réaudite à chaque modification."""
+        mtimes: Dict[str, float] = {}
+        while not should_stop():
+            for path in paths:
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    continue
+                if mtimes.get(path) == mtime:
+                    continue
+                mtimes[path] = mtime
+                try:
+                    changes = self.load_tokens(path)
+                except ValueError:
+                    # Fichier en cours d'écriture : on réessaiera au prochain passage
+                    mtimes.pop(path, None)
+                    continue
+                callback(path, changes)
+            time.sleep(interval)
+
+
+def format_change(change: AuditChange) -> str:
+    """Formate un changement de conformité pour l'affichage."""
+    def describe(result: Optional[PairResult]) -> str:
+        if result is None:
+            return "non résolu"
+        passed = [level for level, ok in result.levels.items() if ok]
+        return f"{result.ratio}:1 ({', '.join(passed) or 'échoue'})"
+
+    return (f"{change.foreground} / {change.background}: "
+            f"{describe(change.before)} -> {describe(change.after)}")
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse les arguments de ligne de commande."""
+    parser = argparse.ArgumentParser(description='Audit de contraste des design tokens')
+    parser.add_argument('pairs', help='Fichier JSON des paires à auditer')
+    parser.add_argument('tokens', nargs='+', help='Fichiers JSON de tokens')
+    parser.add_argument('--watch', action='store_true', help='Surveiller les modifications')
+    parser.add_argument('--interval', type=float, default=0.5, help='Intervalle de surveillance')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande."""
+    args = _parse_args()
+    audit = ContrastAudit()
+    audit.load_pairs(args.pairs)
+    for path in args.tokens:
+        audit.load_tokens(path)
+
+    failing = audit.failing()
+    print(f"{len(audit.results)} paires, {len(failing)} sous AA normal")
+    for foreground, background in failing:
+        print(f"  ❌ {foreground} / {background}")
+
+    if args.watch:
+        def report(path: str, changes: List[AuditChange]) -> None:
+            for change in changes:
+                print(f"[{os.path.basename(path)}] {format_change(change)}")
+
+        # Le premier passage recharge les fichiers sans changement à signaler
+        try:
+            audit.watch(args.tokens, report, args.interval)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,14 @@ Application de conversion de couleurs avec Tkinter.
 
 from typing import Any, Dict, Tuple, Optional
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import sys
 import os
-from src.color_converter import ColorConverter, ColorHarmony, ContrastChecker
+import multiprocessing
+from src.color_converter import ColorConverter, ColorHarmony, ContrastChecker, FORMAT_REGISTRY
+from src.palette_grid import SwatchGrid
+from src.palette_io import PaletteEntry, write_palette
+from src.palette_order import DEFAULT_WINDOW, sort_colors
 
 # Ajouter le dossier src au path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -67,13 +71,7 @@ class ConvertiColorApp:
     STYLE_SECTION: str = 'Section.TLabel'
     STYLE_VALUE: str = 'Value.TLabel'
 
-    FORMATS: Dict[str, Tuple[str, str]] = {
-        'hex': ('Hexadécimal', '#RRGGBB'),
-        'rgb': ('RGB', 'R, G, B (0-255)'),
-        'cmyk': ('CMJN', 'C, M, J, N (0-100%)'),
-        'hsl': ('HSL', 'H (0-360), S, L (0-100%)'),
-        'hsv': ('HSV', 'H (0-360), S, V (0-100%)')
-    }
+    FORMATS: Dict[str, Tuple[str, str]] = FORMAT_REGISTRY.labels()
 
     def __init__(self) -> None:
         self.root: tk.Tk = tk.Tk()
@@ -181,7 +179,13 @@ class ConvertiColorApp:
         format_frame = ttk.Frame(input_frame)
         format_frame.pack(fill=tk.X, pady=(0, 10))
 
+        # Registre relu à la création : les formats tiers enregistrés après l'import
+        # apparaissent ; seuls ceux convertibles vers/depuis RGB sont proposés
+        self.FORMATS = FORMAT_REGISTRY.labels()
+
         for fmt, (name, _) in self.FORMATS.items():
+            if not FORMAT_REGISTRY.has_path(fmt, 'rgb'):
+                continue
             rb = ttk.Radiobutton(
                 format_frame,
                 text=name,
@@ -216,6 +220,8 @@ class ConvertiColorApp:
         self.result_entries: Dict[str, tk.StringVar] = {}
 
         for fmt, (name, _) in self.FORMATS.items():
+            if not FORMAT_REGISTRY.has_path('rgb', fmt):
+                continue
             row = ttk.Frame(results_frame)
             row.pack(fill=tk.X, pady=3)
 
@@ -248,6 +254,27 @@ class ConvertiColorApp:
             lbl = ttk.Label(harmony_labels, text=text, font=('Segoe UI', 8), anchor='center')
             lbl.pack(side=tk.LEFT, expand=True, fill=tk.X)
 
+        # --- Section palette ---
+        palette_frame = ttk.LabelFrame(main_frame, text=" Palette ", padding="10")
+        palette_frame.pack(fill=tk.X, pady=(0, 15))
+
+        palette_buttons = ttk.Frame(palette_frame)
+        palette_buttons.pack(fill=tk.X, pady=(0, 5))
+
+        open_btn = ttk.Button(palette_buttons, text="Ouvrir une palette…",
+                              command=self._open_palette)
+        open_btn.pack(side=tk.LEFT)
+
+        export_btn = ttk.Button(palette_buttons, text="Exporter…", command=self._export_palette)
+        export_btn.pack(side=tk.LEFT, padx=5)
+
+        sort_btn = ttk.Button(palette_buttons, text="Trier", command=self._sort_palette)
+        sort_btn.pack(side=tk.LEFT)
+
+        self.palette_grid = SwatchGrid(palette_frame, on_select=self._select_palette_color,
+                                       bg_color=self.BG_COLOR)
+        self.palette_grid.pack(fill=tk.X)
+
         # --- Section contraste ---
         contrast_frame = ttk.LabelFrame(main_frame, text=" Vérificateur de contraste WCAG ",
                                         padding="10")
@@ -300,23 +327,12 @@ class ConvertiColorApp:
 
     def _update_display(self) -> None:
         """Met à jour l'affichage avec la couleur actuelle."""
-        r, g, b = self.current_rgb
-
-        # Convertir vers tous les formats
-        results = ColorConverter.convert_all(r, g, b)
-
-        # Mettre à jour les champs de résultat
-        self.result_entries['hex'].set(results['hex'])
-        self.result_entries['rgb'].set(f"{r}, {g}, {b}")
-        c, m, y, k = results['cmyk']
-        self.result_entries['cmyk'].set(f"{c}%, {m}%, {y}%, {k}%")
-        h, s, l = results['hsl']
-        self.result_entries['hsl'].set(f"{h}°, {s}%, {l}%")
-        h, s, v = results['hsv']
-        self.result_entries['hsv'].set(f"{h}°, {s}%, {v}%")
+        # Mettre à jour les champs de résultat pour chaque format enregistré
+        for fmt, value_var in self.result_entries.items():
+            value_var.set(FORMAT_REGISTRY.format(self.current_rgb, fmt, source='rgb'))
 
         # Mettre à jour l'aperçu
-        hex_color = results['hex']
+        hex_color = ColorConverter.rgb_to_hex(*self.current_rgb)
         self.color_preview.set_color(hex_color)
 
         # Mettre à jour les harmonies
@@ -408,6 +424,52 @@ class ConvertiColorApp:
             self.contrast_result.config(text="Format hexadécimal invalide")
             self.wcag_details.config(text="")
 
+    def _open_palette(self) -> None:
+        """Charge un fichier palette dans la grille."""
+        path = filedialog.askopenfilename(
+            title="Ouvrir une palette",
+            filetypes=[("Palettes", "*.gpl *.ase *.aco *.css *.json *.txt *.hex"),
+                       ("Tous les fichiers", "*.*")]
+        )
+        if path:
+            self.palette_grid.load_file(path)
+
+    def _sort_palette(self) -> None:
+        """Trie la palette par ordre perceptuel (courbe de Hilbert dans Lab), hors du thread Tk."""
+        if self.palette_grid.colors:
+            # Un seul processus : pas de pool lancé depuis l'interface (exécutable figé)
+            self.palette_grid.reorder(
+                lambda colors: sort_colors(colors, refine=DEFAULT_WINDOW, workers=1))
+
+    def _export_palette(self) -> None:
+        """Exporte la palette chargée (GPL, ASE, ACO, CSS ou JSON)."""
+        if not self.palette_grid.colors:
+            messagebox.showwarning("Palette vide", "Aucune palette à exporter.")
+            return
+
+        path = filedialog.asksaveasfilename(
+            title="Exporter la palette",
+            defaultextension=".gpl",
+            filetypes=[("GIMP", "*.gpl"), ("Adobe ASE", "*.ase"), ("Adobe ACO", "*.aco"),
+                       ("CSS", "*.css"), ("JSON", "*.json")]
+        )
+        if not path:
+            return
+
+        entries = (PaletteEntry(ColorConverter.rgb_to_hex(*rgb), rgb)
+                   for rgb in self.palette_grid.colors)
+        try:
+            count = write_palette(entries, path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Erreur d'export", str(e))
+            return
+        messagebox.showinfo("Exporté", f"{count} couleurs exportées dans {path}")
+
+    def _select_palette_color(self, rgb: Tuple[int, int, int]) -> None:
+        """Affiche la couleur sélectionnée dans la palette."""
+        self.current_rgb = rgb
+        self._update_display()
+
     def _copy_to_clipboard(self, value: str) -> None:
         """Copie une valeur dans le presse-papier."""
         self.root.clipboard_clear()
@@ -436,6 +498,8 @@ class ConvertiColorApp:
 
 def main() -> None:
     """Point d'entrée principal."""
+    # Les pools de processus relanceraient sinon l'application dans l'exécutable PyInstaller
+    multiprocessing.freeze_support()
     app = ConvertiColorApp()
     app.run()
 
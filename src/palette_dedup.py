@@ -0,0 +1,120 @@
+"""
+Module de regroupement des couleurs quasi identiques d'une palette.
+Les couleurs sont regroupées à une tolérance Delta E (CIE76) près, à l'aide
+d'une grille uniforme dans l'espace Lab : chaque couleur n'est comparée
+qu'aux représentants des cellules voisines.
+"""
+
+import argparse
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from src.color_converter import ColorConverter
+from src.palette_io import PaletteEntry, read_palette, write_palette
+from src.palette_order import rgb8_to_lab
+
+# Seuil de différence juste perceptible usuel pour Delta E 76
+DEFAULT_TOLERANCE = 2.3
+
+ColorInput = Union[str, Tuple[int, int, int]]
+Cell = Tuple[int, int, int]
+
+# Décalages vers la cellule elle-même et ses 26 voisines
+NEIGHBOUR_OFFSETS: List[Cell] = [(dl, da, db) for dl in (-1, 0, 1)
+                                 for da in (-1, 0, 1) for db in (-1, 0, 1)]
+
+
+class ColorCluster(NamedTuple):
+    """Groupe de couleurs proches et son représentant."""
+    hex: str
+    rgb: Tuple[int, int, int]
+    count: int
+    members: List[str]
+
+
+def delta_e(lab1: Tuple[float, float, float], lab2: Tuple[float, float, float]) -> float:
+    """Différence de couleur Delta E (CIE76) entre deux couleurs Lab."""
+    return math.sqrt((lab1[0] - lab2[0]) ** 2 + (lab1[1] - lab2[1]) ** 2
+                     + (lab1[2] - lab2[2]) ** 2)
+
+
+def _to_rgb(color: ColorInput) -> Tuple[int, int, int]:
+    """Convertit une entrée (chaîne ou tuple RGB) en RGB."""
+    if isinstance(color, str):
+        return ColorConverter.parse_input(color, ColorConverter.detect_format(color))
+    r, g, b = color
+    return (r, g, b)
+
+
+def cluster_colors(colors: Iterable[ColorInput],
+                   tolerance: float = DEFAULT_TOLERANCE) -> List[ColorCluster]:
+    """
+    Regroupe les couleurs distantes de moins de tolerance (Delta E 76).
+
+    Les doublons exacts sont d'abord comptés ; les couleurs les plus fréquentes
+    deviennent représentantes et les suivantes rejoignent le représentant le
+    plus proche dans les 27 cellules voisines de la grille Lab.
+    """
+    if tolerance <= 0:
+        raise ValueError("La tolérance doit être strictement positive")
+
+    counts: Counter = Counter(_to_rgb(color) for color in colors)
+    limit = tolerance * tolerance
+
+    # Représentants par cellule de grille (côté = tolérance)
+    grid: Dict[Cell, List[int]] = {}
+    leaders: List[Tuple[float, float, float]] = []
+    clusters: List[Tuple[Tuple[int, int, int], List[Tuple[int, int, int]], int]] = []
+    grid_get = grid.get
+
+    for rgb, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        l, a, b = rgb8_to_lab(rgb)
+        cell = (math.floor(l / tolerance), math.floor(a / tolerance), math.floor(b / tolerance))
+
+        best = -1
+        best_distance = limit
+        cl, ca, cb = cell
+        for dl, da, db in NEIGHBOUR_OFFSETS:
+            for index in grid_get((cl + dl, ca + da, cb + db), ()):
+                ll, la, lb = leaders[index]
+                distance = (l - ll) ** 2 + (a - la) ** 2 + (b - lb) ** 2
+                if distance <= best_distance:
+                    best, best_distance = index, distance
+
+        if best < 0:
+            grid.setdefault(cell, []).append(len(leaders))
+            leaders.append((l, a, b))
+            clusters.append((rgb, [rgb], count))
+        else:
+            leader, members, total = clusters[best]
+            members.append(rgb)
+            clusters[best] = (leader, members, total + count)
+
+    return [ColorCluster(ColorConverter.rgb_to_hex(*leader), leader, total,
+                         [ColorConverter.rgb_to_hex(*rgb) for rgb in members])
+            for leader, members, total in clusters]
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande : déduplication d'une palette."""
+    parser = argparse.ArgumentParser(description='Regroupement des couleurs quasi identiques')
+    parser.add_argument('source', help='Palette source (GPL, ASE, ACO, CSS, JSON)')
+    parser.add_argument('target', nargs='?', default=None, help='Palette dédupliquée à écrire')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Tolérance Delta E 76')
+    args = parser.parse_args()
+
+    clusters = cluster_colors((entry.rgb for entry in read_palette(args.source)), args.tolerance)
+    print(f"{len(clusters)} couleurs représentatives")
+
+    if args.target:
+        write_palette((PaletteEntry(cluster.hex, cluster.rgb) for cluster in clusters),
+                      args.target)
+    else:
+        for cluster in clusters:
+            print(f"  {cluster.hex}  ×{cluster.count}  ({len(cluster.members)} nuances)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Grille de nuanciers virtualisée pour l'interface Tkinter.
+Seules les lignes visibles sont dessinées, avec un pool fixe d'items canvas.
+"""
+
+import os
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+import tkinter as tk
+from tkinter import ttk
+
+from src.color_converter import ColorConverter
+from src.palette_io import READERS, read_palette
+
+
+def parse_palette_line(line: str) -> Optional[Tuple[int, int, int]]:
+    """Parse une ligne de palette texte (hex ou R, G, B), None si ignorée."""
+    line = line.strip()
+    if not line or line.startswith(('//', ';')):
+        return None
+    try:
+        return ColorConverter.parse_input(line, ColorConverter.detect_format(line))
+    except ValueError:
+        return None
+
+
+def read_palette_lines(path: str) -> List[Tuple[int, int, int]]:
+    """Lit un fichier palette texte, une couleur par ligne."""
+    colors: List[Tuple[int, int, int]] = []
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            rgb = parse_palette_line(line)
+            if rgb is not None:
+                colors.append(rgb)
+    return colors
+
+
+def read_palette_colors(path: str) -> List[Tuple[int, int, int]]:
+    """Lit une palette GPL/ASE/ACO/CSS/JSON, ou un fichier texte une couleur par ligne."""
+    if os.path.splitext(path)[1].lower() in READERS:
+        return [entry.rgb for entry in read_palette(path)]
+    return read_palette_lines(path)
+
+
+class SwatchGrid(ttk.Frame):
+    """Grille de nuanciers défilante qui ne dessine que les lignes visibles."""
+
+    LOAD_CHUNK: int = 2000
+    POLL_DELAY_MS: int = 50
+
+    def __init__(self, parent: tk.Widget,
+                 on_select: Callable[[Tuple[int, int, int]], None],
+                 swatch_size: int = 28, gap: int = 4, height: int = 180,
+                 bg_color: str = '#F5F5F5', **kwargs: Any) -> None:
+        super().__init__(parent, **kwargs)
+        self.on_select = on_select
+        self.swatch_size = swatch_size
+        self.gap = gap
+        self.row_height = swatch_size + gap
+
+        self.colors: List[Tuple[int, int, int]] = []
+        self._hex: List[str] = []
+        self._offset: int = 0
+        self._columns: int = 1
+        self._pool: List[int] = []
+        self._loader: Optional[threading.Thread] = None
+        self._load_queue: "queue.Queue[Any]" = queue.Queue()
+        self._load_status: str = "Chargement…"
+        self._previous_colors: List[Tuple[int, int, int]] = []
+
+        self.canvas = tk.Canvas(self, height=height, bg=bg_color, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.status = ttk.Label(self, text="Aucune palette chargée", style='Subtitle.TLabel')
+
+        self.status.pack(side=tk.BOTTOM, anchor=tk.W)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Button-1>", self._on_click)
+        # La grille capture la molette pour ne pas faire défiler la fenêtre principale
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_by(-self.row_height))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_by(self.row_height))
+
+    # --- Données ---
+
+    def set_colors(self, colors: List[Tuple[int, int, int]]) -> None:
+        """Remplace le contenu de la grille."""
+        self.colors = list(colors)
+        self._hex = [ColorConverter.rgb_to_hex(*rgb) for rgb in self.colors]
+        self._offset = 0
+        self._refresh()
+
+    def _append_colors(self, colors: List[Tuple[int, int, int]]) -> None:
+        """Ajoute des couleurs à la fin de la grille."""
+        self.colors.extend(colors)
+        self._hex.extend(ColorConverter.rgb_to_hex(*rgb) for rgb in colors)
+        self._refresh()
+
+    def load_file(self, path: str,
+                  reader: Callable[[str], List[Tuple[int, int, int]]] = read_palette_colors) -> None:
+        """Charge une palette dans un thread et l'affiche au fur et à mesure."""
+        self._start_loader(lambda: reader(path), "Chargement…")
+
+    def reorder(self, transform: Callable[[List[Tuple[int, int, int]]],
+                                          List[Tuple[int, int, int]]]) -> None:
+        """Réordonne la palette (ex. tri perceptuel) dans un thread puis la réaffiche."""
+        colors = list(self.colors)
+        self._start_loader(lambda: transform(colors), "Tri…")
+
+    def _start_loader(self, producer: Callable[[], List[Tuple[int, int, int]]],
+                      status: str) -> None:
+        """
+        Vide la grille et la remplit avec le résultat de producer, calculé hors du thread Tk.
+        En cas d'erreur, les couleurs affichées auparavant sont restaurées.
+        """
+        self._previous_colors = list(self.colors)
+        self.set_colors([])
+        self._load_status = status
+        self.status.config(text=status)
+        self._load_queue = queue.Queue()
+        self._loader = threading.Thread(target=self._load_worker,
+                                        args=(producer, self._load_queue), daemon=True)
+        self._loader.start()
+        self.after(self.POLL_DELAY_MS, self._poll_loader, self._load_queue)
+
+    def _load_worker(self, producer: Callable[[], List[Tuple[int, int, int]]],
+                     load_queue: "queue.Queue[Any]") -> None:
+        """Produit les couleurs hors du thread Tk et les transmet par paquets."""
+        try:
+            colors = producer()
+            for start in range(0, len(colors), self.LOAD_CHUNK):
+                load_queue.put(colors[start:start + self.LOAD_CHUNK])
+        except Exception as e:
+            load_queue.put(e)
+        finally:
+            # Le sentinelle est toujours posté : le polling ne tourne jamais indéfiniment
+            load_queue.put(None)
+
+    def _poll_loader(self, load_queue: "queue.Queue[Any]") -> None:
+        """Intègre les paquets chargés depuis le thread Tk."""
+        if load_queue is not self._load_queue:
+            return  # Chargement remplacé par un plus récent
+
+        chunks: List[Tuple[int, int, int]] = []
+        try:
+            while True:
+                item = load_queue.get_nowait()
+                if item is None:
+                    self._previous_colors = []
+                    self._append_colors(chunks)
+                    self.status.config(text=f"{len(self.colors)} couleurs")
+                    return
+                if isinstance(item, Exception):
+                    self.set_colors(self._previous_colors)
+                    self.status.config(text=f"Erreur: {item}")
+                    return
+                chunks.extend(item)
+        except queue.Empty:
+            pass
+
+        if chunks:
+            self._append_colors(chunks)
+            self.status.config(text=f"{self._load_status} {len(self.colors)} couleurs")
+        self.after(self.POLL_DELAY_MS, self._poll_loader, load_queue)
+
+    # --- Géométrie et défilement ---
+
+    def _content_height(self) -> int:
+        """Hauteur totale virtuelle de la grille."""
+        rows = -(-len(self.colors) // self._columns)
+        return rows * self.row_height
+
+    def _max_offset(self) -> int:
+        """Décalage maximal de défilement."""
+        return max(0, self._content_height() - self.canvas.winfo_height())
+
+    def _scroll_to(self, offset: float) -> None:
+        """Positionne le haut de la vue au décalage donné."""
+        self._offset = int(max(0, min(self._max_offset(), offset)))
+        self._render()
+
+    def _scroll_by(self, delta: int) -> str:
+        """Fait défiler la vue de delta pixels."""
+        self._scroll_to(self._offset + delta)
+        return "break"
+
+    def _on_scrollbar(self, action: str, *args: str) -> None:
+        """Gère les commandes de la barre de défilement."""
+        if action == 'moveto':
+            self._scroll_to(float(args[0]) * self._content_height())
+        elif action == 'scroll':
+            amount = int(args[0])
+            step = self.canvas.winfo_height() if args[1] == 'pages' else self.row_height
+            self._scroll_by(amount * step)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        """Gère la molette de la souris."""
+        return self._scroll_by(int(-1 * (event.delta / 120)) * self.row_height)
+
+    def _on_configure(self, event: tk.Event) -> None: # pylint: disable=unused-argument
+        """Recalcule les colonnes et la taille du pool au redimensionnement."""
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Ajuste le pool d'items à la taille visible puis redessine."""
+        width = max(self.canvas.winfo_width(), self.row_height)
+        height = max(self.canvas.winfo_height(), self.row_height)
+        self._columns = max(1, width // self.row_height)
+
+        # Lignes visibles + une ligne partiellement visible
+        pool_size = self._columns * (height // self.row_height + 2)
+        while len(self._pool) < pool_size:
+            self._pool.append(self.canvas.create_rectangle(0, 0, 0, 0, outline="#999",
+                                                           state='hidden'))
+        while len(self._pool) > pool_size:
+            self.canvas.delete(self._pool.pop())
+
+        self._offset = min(self._offset, self._max_offset())
+        self._render()
+
+    def _render(self) -> None:
+        """Recycle les items du pool pour les lignes actuellement visibles."""
+        first_row = self._offset // self.row_height
+        shift = self._offset % self.row_height
+        first_index = first_row * self._columns
+        size = self.swatch_size
+
+        for slot, item in enumerate(self._pool):
+            index = first_index + slot
+            if index >= len(self.colors):
+                self.canvas.itemconfigure(item, state='hidden')
+                continue
+            row, col = divmod(slot, self._columns)
+            x = col * self.row_height + self.gap // 2
+            y = row * self.row_height - shift + self.gap // 2
+            self.canvas.coords(item, x, y, x + size, y + size)
+            self.canvas.itemconfigure(item, fill=self._hex[index], state='normal')
+
+        total = self._content_height()
+        if total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            visible = self.canvas.winfo_height()
+            self.scrollbar.set(self._offset / total, min(1.0, (self._offset + visible) / total))
+
+    def _on_click(self, event: tk.Event) -> None:
+        """Sélectionne le nuancier cliqué."""
+        col = event.x // self.row_height
+        if col >= self._columns:
+            return
+        row = (self._offset + event.y) // self.row_height
+        index = row * self._columns + col
+        if 0 <= index < len(self.colors):
+            self.on_select(self.colors[index])
@@ -0,0 +1,146 @@
+"""
+Module d'indexation de palettes par plages HSL/HSV.
+Les colonnes HSL/HSV sont calculées une seule fois et maintenues triées.
+"""
+
+import bisect
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.color_converter import ColorConverter
+
+# Attributs indexés : nom -> (espace, position dans le tuple)
+ATTRIBUTES: Dict[str, Tuple[str, int]] = {
+    'hue': ('hsl', 0),
+    'saturation': ('hsl', 1),
+    'lightness': ('hsl', 2),
+    'hsv_saturation': ('hsv', 1),
+    'value': ('hsv', 2),
+}
+
+Range = Tuple[float, float]
+
+
+def _hue_bounds(bounds: Range) -> Range:
+    """
+    Ramène une plage de teinte dans [0, 360].
+
+    Une étendue d'au moins 360° couvre tout le cercle ; sinon les deux bornes
+    sont réduites modulo 360 et un début supérieur à la fin traverse 0°.
+    """
+    low, high = bounds
+    if high - low >= 360:
+        return 0.0, 360.0
+    return low % 360, high % 360
+
+
+class IndexedColor(NamedTuple):
+    """Couleur indexée avec ses composantes précalculées."""
+    id: int
+    rgb: Tuple[int, int, int]
+    hsl: Tuple[float, float, float]
+    hsv: Tuple[float, float, float]
+
+    def attribute(self, name: str) -> float:
+        """Retourne la valeur d'un attribut indexé."""
+        space, position = ATTRIBUTES[name]
+        return getattr(self, space)[position]
+
+
+class PaletteIndex:
+    """Index trié d'une palette pour les requêtes par plages de teinte/saturation/etc."""
+
+    def __init__(self, colors: Optional[Iterable[Tuple[int, int, int]]] = None) -> None:
+        self._entries: Dict[int, IndexedColor] = {}
+        self._columns: Dict[str, List[Tuple[float, int]]] = {name: [] for name in ATTRIBUTES}
+        self._next_id = 0
+        if colors is not None:
+            self.extend(colors)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, color_id: int) -> IndexedColor:
+        return self._entries[color_id]
+
+    def _make_entry(self, rgb: Tuple[int, int, int]) -> IndexedColor:
+        """Précalcule les composantes HSL/HSV d'une couleur."""
+        entry = IndexedColor(self._next_id, rgb,
+                             ColorConverter.rgb_to_hsl(*rgb), ColorConverter.rgb_to_hsv(*rgb))
+        self._next_id += 1
+        self._entries[entry.id] = entry
+        return entry
+
+    def extend(self, colors: Iterable[Tuple[int, int, int]]) -> List[int]:
+        """Ajoute un lot de couleurs en ne triant les colonnes qu'une fois."""
+        entries = [self._make_entry(tuple(rgb)) for rgb in colors]  # type: ignore[arg-type]
+        for name, column in self._columns.items():
+            column.extend((entry.attribute(name), entry.id) for entry in entries)
+            column.sort()
+        return [entry.id for entry in entries]
+
+    def add(self, rgb: Tuple[int, int, int]) -> int:
+        """Ajoute une couleur et retourne son identifiant."""
+        entry = self._make_entry(rgb)
+        for name, column in self._columns.items():
+            bisect.insort(column, (entry.attribute(name), entry.id))
+        return entry.id
+
+    def remove(self, color_id: int) -> None:
+        """Retire une couleur de l'index."""
+        entry = self._entries.pop(color_id)
+        for name, column in self._columns.items():
+            key = (entry.attribute(name), entry.id)
+            position = bisect.bisect_left(column, key)
+            if position < len(column) and column[position] == key:
+                del column[position]
+
+    def _slices(self, name: str, bounds: Range) -> List[Tuple[int, int]]:
+        """Retourne les tranches [début, fin) de la colonne couvrant la plage."""
+        column = self._columns[name]
+        low, high = _hue_bounds(bounds) if name == 'hue' else bounds
+
+        if name == 'hue' and low > high:
+            # Plage de teinte qui traverse 0° (ex. 330°-30°) : deux tranches
+            return [
+                (bisect.bisect_left(column, (low, -1)), len(column)),
+                (0, bisect.bisect_right(column, (high, float('inf'))))
+            ]
+
+        return [(bisect.bisect_left(column, (low, -1)),
+                 bisect.bisect_right(column, (high, float('inf'))))]
+
+    @staticmethod
+    def _in_range(name: str, value: float, bounds: Range) -> bool:
+        """Vérifie qu'une valeur appartient à la plage (avec bouclage de la teinte)."""
+        low, high = _hue_bounds(bounds) if name == 'hue' else bounds
+        if name == 'hue' and low > high:
+            return value >= low or value <= high
+        return low <= value <= high
+
+    def query(self, **ranges: Range) -> List[IndexedColor]:
+        """
+        Retourne les couleurs dont chaque attribut est dans la plage donnée.
+
+        Exemple : query(hue=(200, 240), saturation=(40, 100), lightness=(30, 60)).
+        Une plage de teinte dont le début dépasse la fin traverse 0°.
+        """
+        for name in ranges:
+            if name not in ATTRIBUTES:
+                raise ValueError(f"Attribut inconnu: {name}")
+        if not ranges:
+            return list(self._entries.values())
+
+        # Partir de l'attribut le plus sélectif, puis filtrer sur les autres
+        slices = {name: self._slices(name, bounds) for name, bounds in ranges.items()}
+        pivot = min(slices, key=lambda name: sum(end - start for start, end in slices[name]))
+        others = [(name, bounds) for name, bounds in ranges.items() if name != pivot]
+
+        column = self._columns[pivot]
+        results: List[IndexedColor] = []
+        for start, end in slices[pivot]:
+            for _, color_id in column[start:end]:
+                entry = self._entries[color_id]
+                if all(self._in_range(name, entry.attribute(name), bounds)
+                       for name, bounds in others):
+                    results.append(entry)
+        return results
@@ -0,0 +1,399 @@
+"""
+Module d'import/export de palettes.
+Formats : GIMP GPL, Adobe ASE et ACO, propriétés personnalisées CSS, JSON.
+Les lecteurs sont des générateurs et les écritures passent par des E/S
+binaires tamponnées : la mémoire utilisée ne dépend pas de la taille de la palette.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import struct
+import tempfile
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from src.color_converter import ColorConverter
+from src.color_precision import PrecisionConverter
+
+BUFFER_SIZE = 1 << 16
+
+# Nombre de couleurs codé sur 16 bits dans les en-têtes ACO
+ACO_MAX_COLORS = 0xFFFF
+
+RE_CSS_VARIABLE = re.compile(r'--([\w-]+)\s*:\s*([^;]+);')
+RE_CSS_IDENTIFIER = re.compile(r'[^a-z0-9_-]+')
+# Seules les valeurs #hex et les fonctions rgb()/hsl() sont des couleurs CSS
+RE_CSS_COLOR = re.compile(r'#(?:[0-9a-f]{3}){1,2}|(?:rgb|hsl)a?\s*\(.*\)', re.IGNORECASE)
+
+
+class PaletteEntry(NamedTuple):
+    """Couleur nommée d'une palette."""
+    name: str
+    rgb: Tuple[int, int, int]
+
+
+def _read_exact(f: BinaryIO, size: int, kind: str) -> bytes:
+    """Lit exactement size octets ; un fichier trop court lève ValueError."""
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError(f"Fichier {kind} tronqué")
+    return data
+
+
+def _read_struct(f: BinaryIO, fmt: str, kind: str) -> Tuple[Any, ...]:
+    """Lit et décode une structure binaire de taille fixe."""
+    return struct.unpack(fmt, _read_exact(f, struct.calcsize(fmt), kind))
+
+
+# --- GIMP GPL ---
+
+def read_gpl(path: str) -> Iterator[PaletteEntry]:
+    """Lit une palette GIMP (.gpl)."""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        header = f.readline().strip()
+        if header != 'GIMP Palette':
+            raise ValueError("Fichier GPL invalide : en-tête 'GIMP Palette' manquant")
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or line.split(':', 1)[0] in ('Name', 'Columns'):
+                continue
+            parts = line.split(None, 3)
+            if len(parts) < 3:
+                continue
+            rgb = ColorConverter.parse_input(', '.join(parts[:3]), 'rgb')
+            name = parts[3] if len(parts) == 4 else ColorConverter.rgb_to_hex(*rgb)
+            yield PaletteEntry(name, rgb)
+
+
+def write_gpl(entries: Iterable[PaletteEntry], path: str, title: str = 'ConvertiColor') -> int:
+    """Écrit une palette GIMP (.gpl) ; retourne le nombre de couleurs écrites."""
+    count = 0
+    with open(path, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(f"GIMP Palette\nName: {title}\nColumns: 0\n#\n".encode('utf-8'))
+        for name, (r, g, b) in entries:
+            f.write(f"{r:3d} {g:3d} {b:3d}\t{name}\n".encode('utf-8'))
+            count += 1
+    return count
+
+
+# --- Adobe Swatch Exchange (ASE) ---
+
+ASE_SIGNATURE = b'ASEF'
+ASE_COLOR_BLOCK = 0x0001
+
+
+def _ase_color_to_rgb(model: bytes, values: Tuple[float, ...]) -> Tuple[int, int, int]:
+    """Convertit une couleur ASE vers RGB via les convertisseurs."""
+    if model == b'RGB ':
+        return PrecisionConverter.to_8bit(*values)
+    if model == b'CMYK':
+        c, m, y, k = values
+        return ColorConverter.cmyk_to_rgb(c * 100, m * 100, y * 100, k * 100)
+    if model == b'LAB ':
+        l, a, b = values
+        return PrecisionConverter.to_8bit(*PrecisionConverter.lab_to_rgb(l * 100, a, b))
+    if model == b'Gray':
+        return PrecisionConverter.to_8bit(values[0], values[0], values[0])
+    raise ValueError(f"Modèle de couleur ASE inconnu: {model!r}")
+
+
+def read_ase(path: str) -> Iterator[PaletteEntry]:
+    """Lit une palette Adobe Swatch Exchange (.ase)."""
+    channels = {b'RGB ': 3, b'CMYK': 4, b'LAB ': 3, b'Gray': 1}
+    with open(path, 'rb', buffering=BUFFER_SIZE) as f:
+        if f.read(4) != ASE_SIGNATURE:
+            raise ValueError("Fichier ASE invalide : signature manquante")
+        _, _, block_count = _read_struct(f, '>HHI', 'ASE')
+
+        for _ in range(block_count):
+            block_type, length = _read_struct(f, '>HI', 'ASE')
+            block = _read_exact(f, length, 'ASE')
+            if block_type != ASE_COLOR_BLOCK:
+                continue  # Début/fin de groupe
+
+            try:
+                name_length = struct.unpack_from('>H', block)[0]
+                name_end = 2 + name_length * 2
+                name = block[2:name_end].decode('utf-16-be').rstrip('\x00')
+                model = block[name_end:name_end + 4]
+                if model not in channels:
+                    raise ValueError(f"Modèle de couleur ASE inconnu: {model!r}")
+                values = struct.unpack_from(f'>{channels[model]}f', block, name_end + 4)
+            except struct.error as e:
+                raise ValueError("Bloc de couleur ASE tronqué") from e
+            yield PaletteEntry(name, _ase_color_to_rgb(model, values))
+
+
+def write_ase(entries: Iterable[PaletteEntry], path: str) -> int:
+    """Écrit une palette ASE en RGB ; le nombre de blocs est corrigé en fin d'écriture."""
+    count = 0
+    with open(path, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(ASE_SIGNATURE + struct.pack('>HHI', 1, 0, 0))
+        for name, (r, g, b) in entries:
+            encoded_name = (name + '\x00').encode('utf-16-be')
+            body = (struct.pack('>H', len(encoded_name) // 2) + encoded_name + b'RGB '
+                    + struct.pack('>fffH', *PrecisionConverter.from_8bit(r, g, b), 2))
+            f.write(struct.pack('>HI', ASE_COLOR_BLOCK, len(body)) + body)
+            count += 1
+        f.seek(8)
+        f.write(struct.pack('>I', count))
+    return count
+
+
+# --- Adobe Color Swatch (ACO) ---
+
+def _aco_color_to_rgb(space: int, w: int, x: int, y: int, z: int) -> Tuple[int, int, int]:
+    """Convertit une couleur ACO vers RGB via les convertisseurs."""
+    if space == 0:
+        return PrecisionConverter.to_8bit(*PrecisionConverter.from_16bit(w, x, y))
+    if space == 1:
+        return ColorConverter.hsv_to_rgb(w / 182.04, x / 655.35, y / 655.35)
+    if space == 2:
+        # Valeurs CMJN stockées inversées (0 = 100 % d'encre)
+        return ColorConverter.cmyk_to_rgb(100 - w / 655.35, 100 - x / 655.35,
+                                          100 - y / 655.35, 100 - z / 655.35)
+    if space == 7:
+        return PrecisionConverter.to_8bit(*PrecisionConverter.lab_to_rgb(
+            w / 100, struct.unpack('>h', struct.pack('>H', x))[0] / 100,
+            struct.unpack('>h', struct.pack('>H', y))[0] / 100))
+    if space == 8:
+        gray = 1 - w / 10000
+        return PrecisionConverter.to_8bit(gray, gray, gray)
+    raise ValueError(f"Espace de couleur ACO non supporté: {space}")
+
+
+def read_aco(path: str) -> Iterator[PaletteEntry]:
+    """Lit une palette Adobe Color Swatch (.aco), avec les noms de la version 2."""
+    with open(path, 'rb', buffering=BUFFER_SIZE) as f:
+        version, count = _read_struct(f, '>HH', 'ACO')
+        if version == 1:
+            # Sauter la section v1 si une section v2 (avec noms) la suit
+            f.seek(4 + count * 10)
+            header = f.read(4)
+            if len(header) == 4 and struct.unpack('>H', header[:2])[0] == 2:
+                version, count = struct.unpack('>HH', header)
+            else:
+                f.seek(4)
+        if version not in (1, 2):
+            raise ValueError(f"Version ACO non supportée: {version}")
+
+        for index in range(count):
+            space, w, x, y, z = _read_struct(f, '>5H', 'ACO')
+            rgb = _aco_color_to_rgb(space, w, x, y, z)
+            if version == 2:
+                length = _read_struct(f, '>I', 'ACO')[0]
+                name = _read_exact(f, length * 2, 'ACO').decode('utf-16-be').rstrip('\x00')
+            else:
+                name = f"Couleur {index + 1}"
+            yield PaletteEntry(name, rgb)
+
+
+def write_aco(entries: Iterable[PaletteEntry], path: str) -> int:
+    """
+    Écrit une palette ACO (sections v1 puis v2 nommée).
+
+    La section v2 est accumulée dans un fichier temporaire puis recopiée à la
+    suite de la section v1, pour rester en mémoire constante.
+    """
+    count = 0
+    try:
+        with open(path, 'wb', buffering=BUFFER_SIZE) as f, tempfile.TemporaryFile() as names:
+            f.write(struct.pack('>HH', 1, 0))
+            for name, (r, g, b) in entries:
+                if count == ACO_MAX_COLORS:
+                    raise ValueError(f"ACO limité à {ACO_MAX_COLORS} couleurs")
+                color = struct.pack('>5H', 0, *PrecisionConverter.to_16bit(
+                    *PrecisionConverter.from_8bit(r, g, b)), 0)
+                encoded_name = (name + '\x00').encode('utf-16-be')
+                f.write(color)
+                names.write(color + struct.pack('>I', len(encoded_name) // 2) + encoded_name)
+                count += 1
+
+            f.write(struct.pack('>HH', 2, count))
+            names.seek(0)
+            shutil.copyfileobj(names, f, BUFFER_SIZE)  # type: ignore[misc]
+            f.seek(2)
+            f.write(struct.pack('>H', count))
+    except ValueError:
+        # Ne pas laisser de fichier tronqué
+        os.remove(path)
+        raise
+    return count
+
+
+# --- Propriétés personnalisées CSS ---
+
+def read_css(path: str) -> Iterator[PaletteEntry]:
+    """Lit les propriétés personnalisées CSS (--nom: couleur;) ligne par ligne."""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            for name, value in RE_CSS_VARIABLE.findall(line):
+                value = value.strip()
+                if not RE_CSS_COLOR.fullmatch(value):
+                    continue  # Propriété qui n'est pas une couleur (z-index, marges…)
+                try:
+                    rgb = ColorConverter.parse_input(value, ColorConverter.detect_format(value))
+                except ValueError:
+                    continue  # Propriété qui n'est pas une couleur
+                yield PaletteEntry(name, rgb)
+
+
+def _css_identifier(name: str, index: int) -> str:
+    """Transforme un nom de couleur en identifiant CSS."""
+    identifier = RE_CSS_IDENTIFIER.sub('-', name.strip().lower()).strip('-')
+    if not identifier or identifier[0].isdigit():
+        identifier = f"color-{index + 1}"
+    return identifier
+
+
+def write_css(entries: Iterable[PaletteEntry], path: str) -> int:
+    """Écrit une palette sous forme de propriétés personnalisées CSS dans :root."""
+    count = 0
+    with open(path, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(b":root {\n")
+        for index, (name, rgb) in enumerate(entries):
+            line = f"  --{_css_identifier(name, index)}: {ColorConverter.rgb_to_hex(*rgb)};\n"
+            f.write(line.encode('utf-8'))
+            count += 1
+        f.write(b"}\n")
+    return count
+
+
+# --- JSON ---
+
+def _json_entry(item: object, index: int) -> PaletteEntry:
+    """Convertit un élément JSON ({name, hex|rgb} ou chaîne) en entrée de palette."""
+    if isinstance(item, str):
+        rgb = ColorConverter.parse_input(item, ColorConverter.detect_format(item))
+        return PaletteEntry(item, rgb)
+    if isinstance(item, dict):
+        name = str(item.get('name', f"Couleur {index + 1}"))
+        if 'hex' in item:
+            return PaletteEntry(name, ColorConverter.hex_to_rgb(str(item['hex'])))
+        if 'rgb' in item:
+            rgb = item['rgb']
+            if not isinstance(rgb, (list, tuple)) or len(rgb) != 3:
+                raise ValueError(f"Entrée JSON 'rgb' invalide: {rgb!r}")
+            r, g, b = rgb
+            return PaletteEntry(name, ColorConverter.parse_input(f"{r}, {g}, {b}", 'rgb'))
+    raise ValueError(f"Entrée JSON de palette invalide: {item!r}")
+
+
+def read_json(path: str) -> Iterator[PaletteEntry]:
+    """Lit un tableau JSON de couleurs de façon incrémentale (élément par élément)."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        eof = False
+        started = False
+        index = 0
+
+        while True:
+            # Sauter les blancs et séparateurs entre éléments
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+
+            need_more = position == len(buffer)
+            if not need_more:
+                char = buffer[position]
+                if not started:
+                    if char != '[':
+                        raise ValueError("Palette JSON invalide : tableau attendu")
+                    started = True
+                    position += 1
+                    continue
+                if char == ']':
+                    return
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    # Un élément qui touche la fin du tampon peut être incomplet
+                    need_more = end == len(buffer) and not eof
+                except ValueError:
+                    need_more = True
+
+            if need_more:
+                if eof:
+                    raise ValueError("Palette JSON invalide ou tronquée")
+                chunk = f.read(BUFFER_SIZE)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            yield _json_entry(item, index)
+            index += 1
+            position = end
+
+
+def write_json(entries: Iterable[PaletteEntry], path: str) -> int:
+    """Écrit une palette JSON : un objet {name, hex, rgb} par ligne."""
+    count = 0
+    with open(path, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(b"[")
+        for name, rgb in entries:
+            record = {'name': name, 'hex': ColorConverter.rgb_to_hex(*rgb), 'rgb': list(rgb)}
+            f.write((",\n  " if count else "\n  ").encode('ascii'))
+            f.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+            count += 1
+        f.write(b"\n]\n")
+    return count
+
+
+# --- Dispatch par extension ---
+
+READERS: Dict[str, Callable[[str], Iterator[PaletteEntry]]] = {
+    '.gpl': read_gpl,
+    '.ase': read_ase,
+    '.aco': read_aco,
+    '.css': read_css,
+    '.json': read_json,
+}
+
+WRITERS: Dict[str, Callable[[Iterable[PaletteEntry], str], int]] = {
+    '.gpl': write_gpl,
+    '.ase': write_ase,
+    '.aco': write_aco,
+    '.css': write_css,
+    '.json': write_json,
+}
+
+
+def _extension(path: str, table: Dict[str, object], fmt: Optional[str]) -> str:
+    """Détermine le format d'un fichier à partir de son extension."""
+    ext = f".{fmt.lstrip('.')}" if fmt else os.path.splitext(path)[1].lower()
+    if ext not in table:
+        raise ValueError(f"Format de palette non supporté: {ext or path}")
+    return ext
+
+
+def read_palette(path: str, fmt: Optional[str] = None) -> Iterator[PaletteEntry]:
+    """Lit une palette en détectant le format à partir de l'extension."""
+    return READERS[_extension(path, READERS, fmt)](path)  # type: ignore[arg-type]
+
+
+def write_palette(entries: Iterable[PaletteEntry], path: str, fmt: Optional[str] = None) -> int:
+    """Écrit une palette en détectant le format à partir de l'extension."""
+    return WRITERS[_extension(path, WRITERS, fmt)](entries, path)  # type: ignore[arg-type]
+
+
+def convert_palette(source: str, target: str) -> int:
+    """Convertit une palette d'un format à un autre, en flux."""
+    return write_palette(read_palette(source), target)
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande : conversion entre formats de palette."""
+    parser = argparse.ArgumentParser(description='Conversion de palettes')
+    parser.add_argument('source', help=f"Palette source ({', '.join(READERS)})")
+    parser.add_argument('target', help=f"Palette cible ({', '.join(WRITERS)})")
+    args = parser.parse_args()
+
+    count = convert_palette(args.source, args.target)
+    print(f"✓ {count} couleurs écrites dans {args.target}")
+
+
+if __name__ == "__main__":
+    main()
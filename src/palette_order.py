@@ -0,0 +1,281 @@
+"""
+Module d'ordonnancement perceptuel de palettes.
+
+Les couleurs sont projetées dans une grille 3D (Lab ou HSL) puis triées selon
+leur position sur une courbe de remplissage (Hilbert ou Morton) : des couleurs
+voisines dans l'espace restent voisines dans la liste. Un affinage optionnel
+par plus proche voisin, sur une fenêtre glissante, lisse les sauts restants.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.color_precision import D65_WHITE
+from src.palette_io import read_palette, write_palette
+
+CURVES = ('hilbert', 'morton')
+SPACES = ('lab', 'hsl')
+
+DEFAULT_BITS = 8
+DEFAULT_WINDOW = 16
+
+RGB = Tuple[int, int, int]
+Coords = Tuple[int, int, int]
+
+# Bits d'un octet espacés de deux zéros (entrelacement Morton sur 3 axes)
+SPREAD_BITS: List[int] = [
+    sum(((value >> bit) & 1) << (3 * bit) for bit in range(8)) for value in range(256)
+]
+
+# Contributions de chaque canal 8 bits à X, Y et Z (sRGB linéarisé, blanc D65)
+_RGB_TO_XYZ = ((0.4124564, 0.3575761, 0.1804375),
+               (0.2126729, 0.7151522, 0.0721750),
+               (0.0193339, 0.1191920, 0.9503041))
+_XYZ_TABLES: List[List[List[float]]] = [
+    [[coef * (c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4) / white
+      for c in (value / 255.0 for value in range(256))]
+     for coef in row]
+    for row, white in zip(_RGB_TO_XYZ, (D65_WHITE[0], 1.0, D65_WHITE[2]))
+]
+(_XR, _XG, _XB), (_YR, _YG, _YB), (_ZR, _ZG, _ZB) = _XYZ_TABLES
+
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+
+
+def rgb8_to_lab(rgb: RGB) -> Tuple[float, float, float]:
+    """
+    Convertit un RGB 8 bits en CIE Lab (D65) sans arrondi.
+
+    Même résultat que PrecisionConverter.rgb_to_lab, mais la linéarisation
+    et la matrice XYZ sont lues dans des tables précalculées par canal.
+    """
+    r, g, b = rgb
+    x = _XR[r] + _XG[g] + _XB[b]
+    y = _YR[r] + _YG[g] + _YB[b]
+    z = _ZR[r] + _ZG[g] + _ZB[b]
+
+    fx = x ** (1 / 3) if x > _LAB_EPSILON else (_LAB_KAPPA * x + 16) / 116
+    fy = y ** (1 / 3) if y > _LAB_EPSILON else (_LAB_KAPPA * y + 16) / 116
+    fz = z ** (1 / 3) if z > _LAB_EPSILON else (_LAB_KAPPA * z + 16) / 116
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def _lab_coords(rgb: RGB, top: int) -> Coords:
+    """Position d'une couleur dans la grille Lab (L 0-100, a et b -128-128)."""
+    l, a, b = rgb8_to_lab(rgb)
+    lightness = l / 100 * top
+    a = (a + 128) / 256 * top
+    b_axis = (b + 128) / 256 * top
+    return (
+        max(0, min(top, int(lightness + 0.5))),
+        max(0, min(top, int(a + 0.5))),
+        max(0, min(top, int(b_axis + 0.5)))
+    )
+
+
+def _hsl_coords(rgb: RGB, top: int) -> Coords:
+    """Position d'une couleur dans la grille HSL (teinte, saturation, luminosité)."""
+    r, g, b = rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
+    max_c, min_c = max(r, g, b), min(r, g, b)
+    lightness = (max_c + min_c) / 2
+    delta = max_c - min_c
+    if delta == 0:
+        return (0, 0, int(lightness * top + 0.5))
+
+    saturation = delta / (2 - max_c - min_c) if lightness > 0.5 else delta / (max_c + min_c)
+    if max_c == r:
+        hue = ((g - b) / delta) % 6
+    elif max_c == g:
+        hue = (b - r) / delta + 2
+    else:
+        hue = (r - g) / delta + 4
+    return (min(top, int(hue / 6 * top + 0.5)), int(saturation * top + 0.5),
+            int(lightness * top + 0.5))
+
+
+SPACE_COORDS: Dict[str, Callable[[RGB, int], Coords]] = {
+    'lab': _lab_coords,
+    'hsl': _hsl_coords,
+}
+
+# Étendue de chaque axe de la grille dans les unités de l'espace (distances isotropes)
+AXIS_SPANS: Dict[str, Tuple[float, float, float]] = {
+    'lab': (100.0, 256.0, 256.0),
+    'hsl': (1.0, 1.0, 1.0),
+}
+
+
+def morton_index(x: int, y: int, z: int) -> int:
+    """Indice de Morton (ordre Z) de coordonnées 8 bits."""
+    return (SPREAD_BITS[x] << 2) | (SPREAD_BITS[y] << 1) | SPREAD_BITS[z]
+
+
+def hilbert_index(x: int, y: int, z: int, bits: int = DEFAULT_BITS) -> int:
+    """
+    Indice de Hilbert de coordonnées sur bits bits (au plus 8).
+
+    Algorithme de Skilling : les coordonnées sont transformées en
+    « transposée » de l'indice, puis leurs bits sont entrelacés.
+    """
+    q = 1 << (bits - 1)
+    while q > 1:
+        p = q - 1
+        # Axe x : inversion des bits de poids faible
+        if x & q:
+            x ^= p
+        # Axes y et z : inversion ou échange avec x
+        if y & q:
+            x ^= p
+        else:
+            t = (x ^ y) & p
+            x ^= t
+            y ^= t
+        if z & q:
+            x ^= p
+        else:
+            t = (x ^ z) & p
+            x ^= t
+            z ^= t
+        q >>= 1
+
+    # Codage de Gray
+    y ^= x
+    z ^= y
+    t = 0
+    q = 1 << (bits - 1)
+    while q > 1:
+        if z & q:
+            t ^= q - 1
+        q >>= 1
+    return morton_index(x ^ t, y ^ t, z ^ t)
+
+
+def _keys_chunk(colors: Sequence[RGB], curve: str, space: str, bits: int) -> List[int]:
+    """Calcule les clés d'un lot de couleurs (mémorisées par couleur distincte)."""
+    top = (1 << bits) - 1
+    coords = SPACE_COORDS[space]
+    hilbert = curve == 'hilbert'
+    cache: Dict[RGB, int] = {}
+
+    keys: List[int] = []
+    append = keys.append
+    for rgb in colors:
+        key = cache.get(rgb)
+        if key is None:
+            x, y, z = coords(rgb, top)
+            key = hilbert_index(x, y, z, bits) if hilbert else morton_index(x, y, z)
+            cache[rgb] = key
+        append(key)
+    return keys
+
+
+def curve_keys(colors: Sequence[RGB], curve: str = 'hilbert', space: str = 'lab',
+               bits: int = DEFAULT_BITS, workers: Optional[int] = None,
+               chunk_size: int = 1 << 17) -> List[int]:
+    """
+    Calcule la clé de courbe de chaque couleur.
+
+    Au-delà de chunk_size couleurs, les lots sont répartis sur un pool de
+    processus ; chaque couleur distincte d'un lot n'est convertie qu'une fois.
+    """
+    if curve not in CURVES:
+        raise ValueError(f"Courbe inconnue: {curve}")
+    if space not in SPACES:
+        raise ValueError(f"Espace inconnu: {space}")
+    if not 1 <= bits <= 8:
+        raise ValueError("La résolution doit être comprise entre 1 et 8 bits")
+
+    if len(colors) <= chunk_size or workers == 1:
+        return _keys_chunk(colors, curve, space, bits)
+
+    keys: List[int] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_keys_chunk, list(colors[start:start + chunk_size]),
+                                   curve, space, bits)
+                   for start in range(0, len(colors), chunk_size)]
+        for future in futures:
+            keys.extend(future.result())
+    return keys
+
+
+def _refine(colors: Sequence[RGB], order: List[int], window: int, space: str) -> List[int]:
+    """
+    Affinage glouton par plus proche voisin sur une fenêtre glissante.
+
+    À chaque pas, la couleur la plus proche (dans l'espace de la courbe)
+    parmi les window suivantes est ramenée juste après la couleur courante.
+    En HSL, l'écart de teinte est mesuré sur le cercle. Complexité O(N x window).
+    """
+    top = (1 << 10) - 1
+    coords = SPACE_COORDS[space]
+    cache: Dict[RGB, Coords] = {}
+    points: List[Coords] = []
+    for index in order:
+        rgb = colors[index]
+        point = cache.get(rgb)
+        if point is None:
+            point = cache[rgb] = coords(rgb, top)
+        points.append(point)
+    circular = space == 'hsl'
+    wx, wy, wz = (span * span for span in AXIS_SPANS[space])
+
+    order = list(order)
+    for i in range(len(order) - 2):
+        x, y, z = points[i]
+        best, best_distance = i + 1, -1
+        for j in range(i + 1, min(i + 1 + window, len(order))):
+            px, py, pz = points[j]
+            dx = abs(x - px)
+            if circular and dx > top - dx:
+                dx = top - dx
+            distance = wx * dx * dx + wy * (y - py) ** 2 + wz * (z - pz) ** 2
+            if best_distance < 0 or distance < best_distance:
+                best, best_distance = j, distance
+        if best != i + 1:
+            order[i + 1], order[best] = order[best], order[i + 1]
+            points[i + 1], points[best] = points[best], points[i + 1]
+    return order
+
+
+def order_indices(colors: Sequence[RGB], curve: str = 'hilbert', space: str = 'lab',
+                  bits: int = DEFAULT_BITS, refine: int = 0,
+                  workers: Optional[int] = None) -> List[int]:
+    """Retourne les indices des couleurs dans l'ordre perceptuel (refine = fenêtre, 0 = aucun)."""
+    keys = curve_keys(colors, curve, space, bits, workers)
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    if refine > 1:
+        order = _refine(colors, order, refine, space)
+    return order
+
+
+def sort_colors(colors: Iterable[RGB], curve: str = 'hilbert', space: str = 'lab',
+                bits: int = DEFAULT_BITS, refine: int = 0,
+                workers: Optional[int] = None) -> List[RGB]:
+    """Trie des couleurs RGB selon une courbe de remplissage."""
+    colors = list(colors)
+    return [colors[i] for i in order_indices(colors, curve, space, bits, refine, workers)]
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande : tri d'une palette avant export."""
+    parser = argparse.ArgumentParser(description='Tri perceptuel d\'une palette')
+    parser.add_argument('source', help='Palette source (GPL, ASE, ACO, CSS, JSON)')
+    parser.add_argument('target', help='Palette triée à écrire')
+    parser.add_argument('--curve', choices=CURVES, default='hilbert', help='Courbe de remplissage')
+    parser.add_argument('--space', choices=SPACES, default='lab', help='Espace de couleur')
+    parser.add_argument('--refine', type=int, default=0,
+                        help=f'Fenêtre d\'affinage par plus proche voisin (ex. {DEFAULT_WINDOW})')
+    parser.add_argument('--workers', type=int, default=None, help='Nombre de processus')
+    args = parser.parse_args()
+
+    entries = list(read_palette(args.source))
+    order = order_indices([entry.rgb for entry in entries], args.curve, args.space,
+                          refine=args.refine, workers=args.workers)
+    count = write_palette((entries[i] for i in order), args.target)
+    print(f"✓ {count} couleurs triées écrites dans {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Module de stockage binaire de palettes, lu par mappage mémoire.
+
+Disposition du fichier (petit-boutiste) :
+  - en-tête fixe (HEADER) : signature, version, options, nombre de couleurs
+    et positions des colonnes ;
+  - lignes RGB(A) compactes, 3 ou 4 octets par couleur ;
+  - colonnes optionnelles HSL et Lab en float32, 3 valeurs par couleur,
+    alignées sur 4 octets.
+"""
+
+import argparse
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import Any, BinaryIO, Iterable, Sequence, Tuple
+
+from src.color_precision import PrecisionConverter
+from src.palette_io import read_palette
+
+STORE_MAGIC = b'CCPAL\x00'
+STORE_VERSION = 1
+
+FLAG_ALPHA = 0x1
+FLAG_HSL = 0x2
+FLAG_LAB = 0x4
+
+# signature, version, options, réservé, nombre, position RGB, position HSL, position Lab
+HEADER = struct.Struct('<6sHHHQQQQ4x')
+
+BUFFER_SIZE = 1 << 16
+
+
+def _align(offset: int, alignment: int = 4) -> int:
+    """Arrondit une position au multiple supérieur de l'alignement."""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _pad(f: BinaryIO, alignment: int = 4) -> int:
+    """Complète le fichier jusqu'à l'alignement et retourne la position courante."""
+    position = f.tell()
+    aligned = _align(position, alignment)
+    f.write(b'\x00' * (aligned - position))
+    return aligned
+
+
+def write_store(path: str, colors: Iterable[Sequence[float]], alpha: bool = False,
+                hsl: bool = False, lab: bool = False) -> int:
+    """
+    Écrit une palette au format binaire ; retourne le nombre de couleurs.
+
+    colors produit des tuples (r, g, b) ou (r, g, b, a) en 8 bits, alpha en 0-1.
+    Les colonnes HSL/Lab sont accumulées dans des fichiers temporaires puis
+    recopiées après les lignes RGB, pour rester en mémoire constante.
+    """
+    flags = (FLAG_ALPHA if alpha else 0) | (FLAG_HSL if hsl else 0) | (FLAG_LAB if lab else 0)
+    count = 0
+
+    with open(path, 'wb', buffering=BUFFER_SIZE) as f, \
+            tempfile.TemporaryFile() as hsl_file, tempfile.TemporaryFile() as lab_file:
+        f.write(HEADER.pack(STORE_MAGIC, STORE_VERSION, flags, 0, 0, 0, 0, 0))
+        rgb_offset = f.tell()
+
+        for color in colors:
+            r, g, b = int(color[0]), int(color[1]), int(color[2])
+            if alpha:
+                a = color[3] if len(color) > 3 else 1.0
+                f.write(bytes((r, g, b, round(a * 255))))
+            else:
+                f.write(bytes((r, g, b)))
+
+            if hsl or lab:
+                rgb_float = PrecisionConverter.from_8bit(r, g, b)
+                if hsl:
+                    hsl_file.write(struct.pack('<3f', *PrecisionConverter.rgb_to_hsl(*rgb_float)))
+                if lab:
+                    lab_file.write(struct.pack('<3f', *PrecisionConverter.rgb_to_lab(*rgb_float)))
+            count += 1
+
+        hsl_offset = lab_offset = 0
+        if hsl:
+            hsl_offset = _pad(f)
+            hsl_file.seek(0)
+            shutil.copyfileobj(hsl_file, f, BUFFER_SIZE)  # type: ignore[misc]
+        if lab:
+            lab_offset = _pad(f)
+            lab_file.seek(0)
+            shutil.copyfileobj(lab_file, f, BUFFER_SIZE)  # type: ignore[misc]
+
+        f.seek(0)
+        f.write(HEADER.pack(STORE_MAGIC, STORE_VERSION, flags, 0, count,
+                            rgb_offset, hsl_offset, lab_offset))
+    return count
+
+
+class PaletteStore:
+    """
+    Lecteur mappé en mémoire d'une palette binaire.
+
+    Les vues retournées (rows, hsl, lab) ne copient pas les données ; elles
+    doivent être libérées (release ou fin de portée) avant close().
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError("Palette binaire invalide : fichier trop court")
+        (magic, version, self.flags, _, self.count,
+         self._rgb_offset, self._hsl_offset, self._lab_offset) = HEADER.unpack_from(self._mmap)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self._mmap.close()
+            raise ValueError("Palette binaire invalide : signature ou version inconnue")
+
+        self.has_alpha = bool(self.flags & FLAG_ALPHA)
+        self.stride = 4 if self.has_alpha else 3
+
+        # Chaque section annoncée doit tenir dans le fichier
+        sections = [(self._rgb_offset, self.count * self.stride)]
+        if self.flags & FLAG_HSL:
+            sections.append((self._hsl_offset, self.count * 12))
+        if self.flags & FLAG_LAB:
+            sections.append((self._lab_offset, self.count * 12))
+        if any(offset < HEADER.size or offset + size > len(self._mmap)
+               for offset, size in sections):
+            self._mmap.close()
+            raise ValueError("Palette binaire invalide : fichier tronqué")
+
+    def __enter__(self) -> "PaletteStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Ferme le mappage mémoire."""
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Tuple[Any, ...]:
+        """Accès direct O(1) à la couleur d'indice donné (RGB ou RGBA)."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Indice de couleur hors limites")
+        start = self._rgb_offset + index * self.stride
+        row = self._mmap[start:start + self.stride]
+        if self.has_alpha:
+            return (row[0], row[1], row[2], round(row[3] / 255, 3))
+        return (row[0], row[1], row[2])
+
+    @property
+    def rows(self) -> memoryview:
+        """Vue sans copie sur les lignes RGB(A) entrelacées (octets)."""
+        start = self._rgb_offset
+        return memoryview(self._mmap)[start:start + self.count * self.stride]
+
+    def _column(self, flag: int, offset: int, name: str) -> memoryview:
+        """Vue float32 sans copie sur une colonne précalculée."""
+        if not self.flags & flag:
+            raise ValueError(f"La palette ne contient pas de colonne {name}")
+        return memoryview(self._mmap)[offset:offset + self.count * 12].cast('f')
+
+    @property
+    def hsl(self) -> memoryview:
+        """Colonne HSL précalculée (float32, 3 valeurs par couleur)."""
+        return self._column(FLAG_HSL, self._hsl_offset, 'HSL')
+
+    @property
+    def lab(self) -> memoryview:
+        """Colonne Lab précalculée (float32, 3 valeurs par couleur)."""
+        return self._column(FLAG_LAB, self._lab_offset, 'Lab')
+
+    def as_numpy(self, column: str = 'rows') -> Any:
+        """
+        Retourne une vue NumPy sans copie (count x canaux) d'une colonne.
+
+        NumPy n'est pas une dépendance du projet : il n'est importé qu'ici.
+        """
+        try:
+            import numpy as np  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError("NumPy est requis pour as_numpy()") from e
+
+        if column == 'rows':
+            return np.frombuffer(self._mmap, dtype=np.uint8, count=self.count * self.stride,
+                                 offset=self._rgb_offset).reshape(self.count, self.stride)
+        view = getattr(self, column)
+        return np.frombuffer(view, dtype=np.float32).reshape(self.count, 3)
+
+    def convert(self, conversion: str, typecode: str = 'd') -> array:
+        """Applique une conversion PrecisionConverter directement sur les lignes mappées."""
+        rows = self.rows
+        try:
+            return PrecisionConverter.convert_buffer(rows, conversion, typecode, self.stride)
+        finally:
+            rows.release()
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse les arguments de ligne de commande."""
+    parser = argparse.ArgumentParser(description='Palettes binaires mappées en mémoire')
+    parser.add_argument('source', help='Palette source (GPL, ASE, ACO, CSS, JSON)')
+    parser.add_argument('target', help='Fichier binaire de sortie')
+    parser.add_argument('--hsl', action='store_true', help='Précalculer la colonne HSL')
+    parser.add_argument('--lab', action='store_true', help='Précalculer la colonne Lab')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande : conversion d'une palette en binaire."""
+    args = _parse_args()
+    count = write_store(args.target, (entry.rgb for entry in read_palette(args.source)),
+                        hsl=args.hsl, lab=args.lab)
+    print(f"✓ {count} couleurs écrites dans {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Module de vérification exhaustive des allers-retours de conversion.
+Parcourt les 2^24 valeurs RGB par tranches réparties sur un pool de processus.
+"""
+
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.color_converter import ColorConverter
+
+RGB_SPACE_SIZE = 1 << 24
+
+# Paires aller/retour vérifiées par défaut
+ROUNDTRIP_PAIRS: Dict[str, Tuple[Callable[..., Any], Callable[..., Any]]] = {
+    'hsl': (ColorConverter.rgb_to_hsl, ColorConverter.hsl_to_rgb),
+    'hsv': (ColorConverter.rgb_to_hsv, ColorConverter.hsv_to_rgb),
+    'cmyk': (ColorConverter.rgb_to_cmyk, ColorConverter.cmyk_to_rgb),
+}
+
+# (valeur RGB d'entrée, résultat obtenu)
+Failure = Tuple[Tuple[int, int, int], Tuple[Any, ...]]
+
+
+class VerificationReport(NamedTuple):
+    """Rapport de vérification d'une paire de fonctions."""
+    name: str
+    total: int
+    histogram: Dict[float, int]
+    failure_count: int
+    failures: List[Failure]
+    elapsed: float
+
+    def summary(self) -> str:
+        """Résumé lisible du rapport."""
+        lines = [f"{self.name}: {self.total - self.failure_count}/{self.total} exacts "
+                 f"({self.failure_count} écarts) en {self.elapsed:.1f}s"]
+        for drift, count in sorted(self.histogram.items()):
+            lines.append(f"  écart {drift}: {count}")
+        for rgb, result in self.failures[:10]:
+            lines.append(f"  {ColorConverter.rgb_to_hex(*rgb)} -> {result}")
+        return "\n".join(lines)
+
+
+def _roundtrip_chunk(forward: Callable[..., Any], inverse: Callable[..., Any],
+                     start: int, stop: int,
+                     max_failures: int) -> Tuple[Counter, int, List[Failure]]:
+    """Vérifie rgb -> forward -> inverse -> rgb pour une tranche de valeurs."""
+    histogram: Counter = Counter()
+    failures: List[Failure] = []
+    failure_count = 0
+    for value in range(start, stop):
+        rgb = (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+        back = inverse(*forward(*rgb))
+        drift = max(abs(back[0] - rgb[0]), abs(back[1] - rgb[1]), abs(back[2] - rgb[2]))
+        histogram[drift] += 1
+        if drift:
+            failure_count += 1
+            if len(failures) < max_failures:
+                failures.append((rgb, tuple(back)))
+    return histogram, failure_count, failures
+
+
+def _compare_chunk(reference: Callable[..., Any], candidate: Callable[..., Any],
+                   start: int, stop: int, tolerance: float,
+                   max_failures: int) -> Tuple[Counter, int, List[Failure]]:
+    """Compare une implémentation candidate à la référence pour une tranche."""
+    histogram: Counter = Counter()
+    failures: List[Failure] = []
+    failure_count = 0
+    for value in range(start, stop):
+        rgb = (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+        expected = reference(*rgb)
+        got = candidate(*rgb)
+        drift = max(abs(a - b) for a, b in zip(expected, got))
+        histogram[round(drift, 1)] += 1
+        if drift > tolerance:
+            failure_count += 1
+            if len(failures) < max_failures:
+                failures.append((rgb, tuple(got)))
+    return histogram, failure_count, failures
+
+
+def _run_chunks(name: str, worker: Callable[..., Tuple[Counter, int, List[Failure]]],
+                functions: Sequence[Callable[..., Any]], options: Sequence[Any],
+                start: int, stop: int, chunk_size: int, workers: Optional[int],
+                max_failures: int) -> VerificationReport:
+    """
+    Répartit la plage en tranches sur le pool et fusionne les résultats.
+
+    Une plage d'une seule tranche, ou workers == 1, est traitée dans le
+    processus courant : les fonctions n'ont alors pas besoin d'être sérialisables.
+    """
+    started = time.perf_counter()
+    if stop - start <= chunk_size or workers == 1:
+        histogram, failure_count, failures = worker(*functions, start, stop, *options)
+        return VerificationReport(name, stop - start, dict(histogram), failure_count,
+                                  failures[:max_failures], time.perf_counter() - started)
+
+    histogram = Counter()
+    failures = []
+    failure_count = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker, *functions, low, min(low + chunk_size, stop), *options)
+                   for low in range(start, stop, chunk_size)]
+        for future in futures:
+            chunk_histogram, chunk_failures, chunk_samples = future.result()
+            histogram.update(chunk_histogram)
+            failure_count += chunk_failures
+            failures.extend(chunk_samples[:max_failures - len(failures)])
+
+    return VerificationReport(name, stop - start, dict(histogram), failure_count, failures,
+                              time.perf_counter() - started)
+
+
+def verify_roundtrip(name: str, forward: Callable[..., Any], inverse: Callable[..., Any],
+                     start: int = 0, stop: int = RGB_SPACE_SIZE, chunk_size: int = 1 << 16,
+                     workers: Optional[int] = None,
+                     max_failures: int = 100) -> VerificationReport:
+    """
+    Vérifie l'aller-retour forward/inverse sur la plage de valeurs RGB 24 bits.
+
+    Avec plusieurs tranches, les fonctions doivent être définies au niveau
+    module (sérialisables) pour être envoyées aux processus du pool.
+    """
+    return _run_chunks(name, _roundtrip_chunk, (forward, inverse), (max_failures,),
+                       start, stop, chunk_size, workers, max_failures)
+
+
+def compare_engines(name: str, reference: Callable[..., Any], candidate: Callable[..., Any],
+                    tolerance: float = 0.0, start: int = 0, stop: int = RGB_SPACE_SIZE,
+                    chunk_size: int = 1 << 16, workers: Optional[int] = None,
+                    max_failures: int = 100) -> VerificationReport:
+    """Valide une implémentation (moteur rapide) contre la référence sur toutes les entrées."""
+    return _run_chunks(name, _compare_chunk, (reference, candidate), (tolerance, max_failures),
+                       start, stop, chunk_size, workers, max_failures)
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse les arguments de ligne de commande."""
+    parser = argparse.ArgumentParser(description='Vérification exhaustive des allers-retours')
+    parser.add_argument('--pairs', nargs='+', default=list(ROUNDTRIP_PAIRS),
+                        choices=list(ROUNDTRIP_PAIRS), help='Paires à vérifier')
+    parser.add_argument('--limit', type=int, default=RGB_SPACE_SIZE,
+                        help='Nombre de valeurs RGB à parcourir')
+    parser.add_argument('--workers', type=int, default=None, help='Nombre de processus')
+    parser.add_argument('--chunk-size', type=int, default=1 << 16, help='Taille des tranches')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Point d'entrée en ligne de commande."""
+    args = _parse_args()
+    for name in args.pairs:
+        forward, inverse = ROUNDTRIP_PAIRS[name]
+        report = verify_roundtrip(name, forward, inverse, stop=min(args.limit, RGB_SPACE_SIZE),
+                                  chunk_size=args.chunk_size, workers=args.workers)
+        print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
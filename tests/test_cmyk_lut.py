@@ -0,0 +1,72 @@
+"""Tests de la conversion CMJN par LUT."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+
+from src.cmyk_lut import _TABLES, CmykLut, generate_lut, load_table, use_lut
+from src.color_converter import ColorConverter
+
+
+class TestCmykLut(unittest.TestCase):
+    """LUT générées depuis la formule de référence."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.forward = os.path.join(cls.tmp.name, 'rgb_to_cmyk.csv')
+        cls.inverse = os.path.join(cls.tmp.name, 'cmyk_to_rgb.csv')
+        generate_lut(cls.forward, 'rgb_to_cmyk', size=9)
+        generate_lut(cls.inverse, 'cmyk_to_rgb', size=5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def tearDown(self):
+        ColorConverter.set_cmyk_backend(None)
+
+    def test_grid_nodes_exact(self):
+        lut = CmykLut(self.forward)
+        for rgb in ((0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 255, 255)):
+            self.assertEqual(lut.rgb_to_cmyk(*rgb), ColorConverter.rgb_to_cmyk(*rgb))
+
+    def test_multilinear_inverse_matches_formula(self):
+        lut = CmykLut(cmyk_to_rgb_path=self.inverse)
+        for cmyk in ((30, 40, 50, 20), (0, 65.9, 80, 0), (100, 0, 0, 55)):
+            self.assertEqual(lut.cmyk_to_rgb(*cmyk), ColorConverter.cmyk_to_rgb(*cmyk))
+
+    def test_backend_behind_parse_input(self):
+        use_lut(self.forward, self.inverse)
+        self.assertEqual(ColorConverter.parse_input('0, 100, 100, 0', 'cmyk'), (255, 0, 0))
+        self.assertEqual(ColorConverter.convert_all(255, 0, 0)['cmyk'], (0.0, 100.0, 100.0, 0.0))
+
+    def test_cache_written(self):
+        CmykLut(self.forward)
+        self.assertTrue(os.path.exists(self.forward + '.lutcache'))
+
+    def test_truncated_cache_recompiled(self):
+        path = os.path.join(self.tmp.name, 'tronque.csv')
+        shutil.copyfile(self.forward, path)
+        expected = list(load_table(path).data)
+        _TABLES.pop(os.path.abspath(path))
+        with open(path + '.lutcache', 'r+b') as f:
+            f.truncate(100)
+        table = load_table(path)
+        self.assertEqual(list(table.data), expected)
+        self.assertEqual(len(table.data), table.channels * table.size ** table.dims)
+
+    def test_convert_buffer_walks_view(self):
+        lut = CmykLut(self.forward, self.inverse)
+        pixels = array('B', [255, 0, 0, 0, 0, 0, 255, 255])
+        output = lut.convert_buffer(pixels)
+        self.assertEqual(len(output), 8)  # Le dernier pixel incomplet est ignoré
+        self.assertEqual([round(v, 1) for v in output[:4]], [0.0, 100.0, 100.0, 0.0])
+        rgb = lut.convert_buffer(array('f', [0, 100, 100, 0]), 'cmyk_to_rgb')
+        self.assertEqual([round(v) for v in rgb], [255, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+"""Tests du convertisseur de couleurs."""
+
+import unittest
+
+from src.color_converter import ColorConverter
+
+
+class TestAlphaHandling(unittest.TestCase):
+    """Les entrées opaques refusent l'alpha ; les variantes RGBA le conservent."""
+
+    def test_hex_to_rgb_rejects_alpha(self):
+        for value in ('#11223380', '#1234'):
+            with self.assertRaises(ValueError):
+                ColorConverter.hex_to_rgb(value)
+
+    def test_parse_rgb_rejects_alpha(self):
+        with self.assertRaises(ValueError):
+            ColorConverter.parse_input('rgba(1, 2, 3, 0.5)', 'rgb')
+
+    def test_rgba_variants_keep_alpha(self):
+        self.assertEqual(ColorConverter.hex_to_rgba('#11223380'), (17, 34, 51, 0.502))
+        self.assertEqual(ColorConverter.parse_input_rgba('rgba(1, 2, 3, 0.5)', 'rgb'),
+                         (1, 2, 3, 0.5))
+        self.assertEqual(ColorConverter.parse_input_rgba('#112233', 'hex'), (17, 34, 51, 1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests du registre de formats et du graphe de conversion."""
+
+import unittest
+
+from src.color_converter import FORMAT_REGISTRY, ColorConverter, _build_default_registry
+from src.color_formats import ColorFormat
+
+
+def _gray_format(edges):
+    return ColorFormat('gray', 'Gris', 'G (0-255)',
+                       parser=lambda text: int(text),
+                       formatter=str,
+                       edges=edges)
+
+
+class TestBuiltinFormats(unittest.TestCase):
+    """parse_input sur chaque format intégré."""
+
+    def test_parse_input(self):
+        cases = {
+            'hex': ['#FF5733', 'FF5733', '#F53'],
+            'rgb': ['255, 87, 51', 'rgb(255, 87, 51)'],
+            'cmyk': ['0, 65.9, 80, 0'],
+            'hsl': ['10.6, 100, 60'],
+            'hsv': ['10.6, 80, 100'],
+        }
+        expected = {'#F53': (255, 85, 51)}
+        for fmt, inputs in cases.items():
+            for text in inputs:
+                with self.subTest(fmt=fmt, text=text):
+                    self.assertEqual(ColorConverter.parse_input(text, fmt),
+                                     expected.get(text, (255, 87, 51)))
+
+    def test_invalid_input(self):
+        for fmt, text in (('hex', '#GGGGGG'), ('rgb', '300, 0, 0'), ('cmyk', '1, 2, 3'),
+                          ('hsl', '1, 2'), ('unknown', '1')):
+            with self.subTest(fmt=fmt):
+                with self.assertRaises(ValueError):
+                    ColorConverter.parse_input(text, fmt)
+
+    def test_format_matches_convert_all(self):
+        rgb = (18, 52, 86)
+        data = ColorConverter.convert_all(*rgb)
+        self.assertEqual(FORMAT_REGISTRY.format(rgb, 'hex', source='rgb'), data['hex'])
+        self.assertEqual(FORMAT_REGISTRY.convert(rgb, 'rgb', 'cmyk'), data['cmyk'])
+        self.assertEqual(FORMAT_REGISTRY.convert(rgb, 'rgb', 'hsl'), data['hsl'])
+
+    def test_direct_edges(self):
+        self.assertEqual(FORMAT_REGISTRY.find_path('cmyk', 'hsl'), ['cmyk', 'hsl'])
+        self.assertEqual(FORMAT_REGISTRY.find_path('hex', 'hsv'), ['hex', 'rgb', 'hsv'])
+
+
+class TestThirdPartyFormat(unittest.TestCase):
+    """Formats tiers branchés sur un registre neuf (le registre global n'est pas modifié)."""
+
+    def setUp(self):
+        self.registry = _build_default_registry()
+
+    def test_plugged_format_reaches_all_formats(self):
+        self.registry.register(_gray_format({'rgb': lambda g: (g, g, g)}))
+        self.assertEqual(self.registry.find_path('gray', 'hsl'), ['gray', 'rgb', 'hsl'])
+        self.assertEqual(self.registry.parse('128', 'gray', 'hex'), '#808080')
+        self.assertIn('gray', self.registry.labels())
+
+    def test_one_way_format(self):
+        self.registry.register(_gray_format({'rgb': lambda g: (g, g, g)}))
+        self.assertTrue(self.registry.has_path('gray', 'rgb'))
+        self.assertFalse(self.registry.has_path('rgb', 'gray'))
+        with self.assertRaises(ValueError):
+            self.registry.format((1, 2, 3), 'gray', source='rgb')
+
+    def test_add_edge_invalidates_compiled_paths(self):
+        self.registry.register(_gray_format({'rgb': lambda g: (g, g, g)}))
+        self.registry.add_edge('rgb', 'gray', lambda v: round(sum(v) / 3))
+        self.assertEqual(self.registry.format((10, 20, 30), 'gray', source='rgb'), '20')
+        self.assertEqual(self.registry.convert('#0A141E', 'hex', 'gray'), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
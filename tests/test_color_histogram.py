@@ -0,0 +1,48 @@
+"""Tests de l'analyse des couleurs d'une image."""
+
+import unittest
+from collections import Counter
+
+from src.color_histogram import ColorHistogram, analyze_pixels, pack_rgb, unpack_rgb
+
+PIXELS = bytes([255, 0, 0, 255, 0, 0, 0, 255, 0, 18, 52, 86, 255, 0, 0])
+
+
+class TestColorHistogram(unittest.TestCase):
+    """Bitmap des couleurs présentes et comptage."""
+
+    def test_pack_round_trip(self):
+        self.assertEqual(unpack_rgb(pack_rgb(18, 52, 86)), (18, 52, 86))
+
+    def test_unique_and_counts(self):
+        histogram = ColorHistogram()
+        histogram.add_pixels(PIXELS)
+        self.assertEqual(histogram.unique_count(), 3)
+        self.assertEqual(histogram.pixel_count, 5)
+        self.assertIn((18, 52, 86), histogram)
+        self.assertNotIn((1, 2, 3), histogram)
+        self.assertEqual(histogram.top_colors(1)[0]['hex'], '#FF0000')
+        self.assertEqual(histogram.top_colors(1)[0]['count'], 3)
+
+    def test_rgba_channels_and_tiles(self):
+        rgba = bytes(b for i in range(0, len(PIXELS), 3) for b in PIXELS[i:i + 3] + b'\x80')
+        histogram = analyze_pixels(rgba, channels=4, tile_pixels=2, workers=1)
+        self.assertEqual(dict(histogram.items()),
+                         dict(Counter(pack_rgb(*PIXELS[i:i + 3])
+                                      for i in range(0, len(PIXELS), 3))))
+
+    def test_without_counts(self):
+        histogram = ColorHistogram(None)
+        histogram.add_pixels(PIXELS)
+        self.assertEqual(sorted(histogram.packed_colors()),
+                         sorted({pack_rgb(*PIXELS[i:i + 3]) for i in range(0, len(PIXELS), 3)}))
+        with self.assertRaises(ValueError):
+            list(histogram.items())
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            ColorHistogram('dense')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests des conversions haute précision."""
+
+import unittest
+from array import array
+
+from src.color_converter import ColorConverter
+from src.color_precision import PrecisionConverter
+
+
+class TestPrecisionConverter(unittest.TestCase):
+    """Conversions flottantes et traitement par tampons."""
+
+    def test_hsl_round_trip_without_rounding(self):
+        for rgb in ((0.2, 0.4, 0.6), (1.0, 0.0, 0.5), (0.5, 0.5, 0.5)):
+            with self.subTest(rgb=rgb):
+                back = PrecisionConverter.hsl_to_rgb(*PrecisionConverter.rgb_to_hsl(*rgb))
+                for expected, got in zip(rgb, back):
+                    self.assertAlmostEqual(expected, got, places=12)
+
+    def test_rgb_to_hsl_out_of_gamut(self):
+        # Auparavant : ZeroDivisionError (L = 100 %) ou saturation négative
+        self.assertEqual(PrecisionConverter.rgb_to_hsl(1.5, 0.5, 0.5),
+                         PrecisionConverter.rgb_to_hsl(1.0, 0.5, 0.5))
+        h, s, l = PrecisionConverter.rgb_to_hsl(2.0, -0.2, 0.5)
+        self.assertTrue(0 <= s <= 100 and 0 <= l <= 100)
+
+    def test_matches_rounded_converter(self):
+        for rgb in ((255, 0, 0), (18, 52, 86), (200, 200, 10)):
+            with self.subTest(rgb=rgb):
+                h, s, l = PrecisionConverter.rgb_to_hsl(*PrecisionConverter.from_8bit(*rgb))
+                self.assertEqual((round(h, 1), round(s, 1), round(l, 1)),
+                                 ColorConverter.rgb_to_hsl(*rgb))
+
+    def test_lab_round_trip(self):
+        rgb = PrecisionConverter.from_8bit(18, 52, 86)
+        back = PrecisionConverter.lab_to_rgb(*PrecisionConverter.rgb_to_lab(*rgb))
+        self.assertEqual(PrecisionConverter.to_8bit(*back), (18, 52, 86))
+
+    def test_convert_buffer_stride(self):
+        pixels = array('B', [255, 0, 0, 7, 0, 0, 255, 7])
+        output = PrecisionConverter.convert_buffer(pixels, 'rgb_to_hsv', stride=4)
+        self.assertEqual(list(output), [0.0, 100.0, 100.0, 240.0, 100.0, 100.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
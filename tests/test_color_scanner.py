@@ -0,0 +1,57 @@
+"""Tests de l'inventaire des couleurs d'une arborescence."""
+
+import os
+import tempfile
+import unittest
+
+from src.color_scanner import scan_file, scan_tree
+
+CSS = b"""#add { color: #fade; }
+#bad, #feed.active {
+  background: #cafe;
+  box-shadow: 0 0 1px #112233, 0 0 2px rgba(0, 0, 0, 0.5);
+}
+#fff:hover > p { border-color: #11223380 }
+"""
+
+JSON = b'{"primary": "#add", "nested": {"bg": "#000000"}, "list": ["#fff", "hsl(0, 100%, 50%)"]}'
+
+
+class TestColorScanner(unittest.TestCase):
+    """Extraction des littéraux et inventaire."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, content in (('style.css', CSS), ('tokens.json', JSON)):
+            with open(os.path.join(self.tmp.name, name), 'wb') as f:
+                f.write(content)
+
+    def literals(self, name):
+        return [literal for _, literal, *_ in scan_file(os.path.join(self.tmp.name, name))]
+
+    def test_id_selectors_ignored(self):
+        self.assertEqual(self.literals('style.css'),
+                         ['#fade', '#cafe', '#112233', 'rgba(0, 0, 0, 0.5)', '#11223380'])
+
+    def test_json_string_values(self):
+        self.assertEqual(self.literals('tokens.json'),
+                         ['#add', '#000000', '#fff', 'hsl(0, 100%, 50%)'])
+
+    def test_line_and_column(self):
+        occurrences = scan_file(os.path.join(self.tmp.name, 'style.css'))
+        self.assertEqual(occurrences[1][3:], (3, 15))
+
+    def test_inventory_keeps_alpha(self):
+        inventory = scan_tree(self.tmp.name, use_processes=False)
+        self.assertIn('#112233', inventory)
+        self.assertIn('#11223380', inventory)
+        self.assertEqual(inventory['#11223380']['data']['rgba'], (17, 34, 51, 0.502))
+        self.assertNotIn('rgba', inventory['#112233']['data'])
+        # '#add' n'est une couleur que dans le JSON, pas comme sélecteur CSS
+        self.assertEqual([occ['path'] for occ in inventory['#AADDDD']['occurrences']],
+                         [os.path.join(self.tmp.name, 'tokens.json')])
+
+
+if __name__ == '__main__':
+    unittest.main()
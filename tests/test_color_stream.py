@@ -0,0 +1,38 @@
+"""Tests de la conversion asynchrone de flux."""
+
+import asyncio
+import unittest
+
+from src.color_stream import aconvert_stream, convert_batch
+
+
+async def _source(values):
+    for value in values:
+        yield value
+        await asyncio.sleep(0)
+
+
+class TestColorStream(unittest.TestCase):
+    """Conversion par lots et erreurs par entrée."""
+
+    def test_convert_batch_reports_errors(self):
+        results = convert_batch(['#FF0000', 'zz'], 'hex')
+        self.assertEqual(results[0].rgb, (255, 0, 0))
+        self.assertEqual(results[0].data['hex'], '#FF0000')
+        self.assertIsNone(results[1].rgb)
+        self.assertIsNotNone(results[1].error)
+
+    def test_stream_preserves_order(self):
+        values = [f"#{i:06X}" for i in range(1000)]
+
+        async def collect():
+            return [result async for result in aconvert_stream(_source(values), 'hex',
+                                                                batch_size=64)]
+
+        results = asyncio.run(collect())
+        self.assertEqual([result.raw for result in results], values)
+        self.assertTrue(all(result.error is None for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
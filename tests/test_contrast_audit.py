@@ -0,0 +1,69 @@
+"""Tests de l'audit incrémental de contraste."""
+
+import unittest
+
+from src.color_converter import ContrastChecker
+from src.contrast_audit import ContrastAudit
+
+
+class TestContrastAudit(unittest.TestCase):
+    """Tests de ContrastAudit."""
+
+    def setUp(self):
+        self.audit = ContrastAudit()
+        self.audit.add_pair('fg', 'bg')
+
+    def test_pair_evaluated(self):
+        self.audit.update_tokens('base', {'fg': '#000000', 'bg': '#FFFFFF'})
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio, 21.0)
+
+    def test_alias_resolution(self):
+        self.audit.update_tokens('base', {'black': '#000000', 'fg': '{black}',
+                                          'bg': '#FFFFFF'})
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio, 21.0)
+        self.audit.update_tokens('base', {'black': '#FFFFFF', 'fg': '{black}',
+                                          'bg': '#FFFFFF'})
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio, 1.0)
+
+    def test_override_then_remove(self):
+        self.audit.update_tokens('base', {'fg': '#000000', 'bg': '#FFFFFF'})
+        self.audit.update_tokens('theme', {'bg': '#000000'})
+        self.assertEqual(self.audit.values['bg'], '#000000')
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio, 1.0)
+
+        changes = self.audit.update_tokens('theme', {})
+        self.assertEqual(self.audit.values['bg'], '#FFFFFF')
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio, 21.0)
+        self.assertEqual(len(changes), 1)
+
+    def test_reload_unchanged_keeps_override(self):
+        self.audit.update_tokens('base', {'fg': '#000000', 'bg': '#FFFFFF'})
+        self.audit.update_tokens('theme', {'bg': '#000000'})
+        # Recharger la base sans modification ne doit pas reprendre la main
+        self.assertEqual(self.audit.update_tokens('base', {'fg': '#000000', 'bg': '#FFFFFF'}), [])
+        self.assertEqual(self.audit.values['bg'], '#000000')
+
+    def test_remove_last_source(self):
+        self.audit.update_tokens('base', {'fg': '#000000', 'bg': '#FFFFFF'})
+        self.audit.update_tokens('base', {'fg': '#000000'})
+        self.assertNotIn('bg', self.audit.values)
+        self.assertIsNone(self.audit.results[('fg', 'bg')])
+
+    def test_translucent_foreground_composited_over_background(self):
+        # Noir à 50 % : gris moyen sur blanc, presque noir sur un fond sombre
+        self.audit.update_tokens('base', {'fg': 'rgba(0, 0, 0, 0.5)', 'bg': '#FFFFFF'})
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio,
+                         ContrastChecker.contrast_ratio((128, 128, 128), (255, 255, 255)))
+        self.assertFalse(self.audit.results[('fg', 'bg')].levels['AA_normal'])
+
+        self.audit.update_tokens('base', {'fg': 'rgba(0, 0, 0, 0.5)', 'bg': '#202020'})
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio,
+                         ContrastChecker.contrast_ratio((16, 16, 16), (32, 32, 32)))
+
+    def test_translucent_alias_and_opaque_alpha(self):
+        self.audit.update_tokens('base', {'ink': '#000000FF', 'fg': '{ink}', 'bg': '#FFFFFF'})
+        self.assertEqual(self.audit.results[('fg', 'bg')].ratio, 21.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
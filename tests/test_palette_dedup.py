@@ -0,0 +1,29 @@
+"""Tests du regroupement des couleurs quasi identiques."""
+
+import unittest
+
+from src.palette_dedup import cluster_colors
+
+
+class TestClusterColors(unittest.TestCase):
+    """Regroupement à tolérance Delta E."""
+
+    def test_near_duplicates_merged(self):
+        clusters = cluster_colors(['#FF0000', '#FE0000', '#FF0000', '#0000FF'])
+        self.assertEqual(len(clusters), 2)
+        red = clusters[0]
+        self.assertEqual(red.hex, '#FF0000')
+        self.assertEqual(red.count, 3)
+        self.assertEqual(red.members, ['#FF0000', '#FE0000'])
+
+    def test_distinct_colors_kept(self):
+        colors = [(0, 0, 0), (128, 128, 128), (255, 255, 255)]
+        self.assertEqual(len(cluster_colors(colors)), 3)
+
+    def test_invalid_tolerance(self):
+        with self.assertRaises(ValueError):
+            cluster_colors([(0, 0, 0)], tolerance=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
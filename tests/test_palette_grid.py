@@ -0,0 +1,91 @@
+"""Tests de la logique de chargement de la grille de nuanciers (sans affichage Tk)."""
+
+import os
+import queue
+import tempfile
+import unittest
+
+from src.palette_grid import SwatchGrid, parse_palette_line, read_palette_lines
+
+
+class _Status:
+    """Remplace l'étiquette de statut Tk."""
+
+    def __init__(self):
+        self.text = ''
+
+    def config(self, text):
+        self.text = text
+
+
+def _headless_grid(colors):
+    """Construit une grille sans fenêtre : le rendu et la planification sont neutralisés."""
+    grid = SwatchGrid.__new__(SwatchGrid)
+    grid.colors = list(colors)
+    grid._hex = []
+    grid._offset = 0
+    grid._load_status = "Tri…"
+    grid._previous_colors = []
+    grid._load_queue = queue.Queue()
+    grid.status = _Status()
+    grid._refresh = lambda: None
+    grid.after = lambda delay, callback, *args: None
+    return grid
+
+
+class TestPaletteLines(unittest.TestCase):
+    """Lecture des palettes texte, une couleur par ligne."""
+
+    def test_parse_palette_line(self):
+        self.assertEqual(parse_palette_line('#FF0000'), (255, 0, 0))
+        self.assertEqual(parse_palette_line('0, 128, 255'), (0, 128, 255))
+        self.assertIsNone(parse_palette_line('// commentaire'))
+        self.assertIsNone(parse_palette_line('pas une couleur'))
+
+    def test_read_palette_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'palette.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("#000000\n; ignoré\n\n255, 255, 255\n")
+            self.assertEqual(read_palette_lines(path), [(0, 0, 0), (255, 255, 255)])
+
+
+class TestSwatchGridLoader(unittest.TestCase):
+    """Transmission des couleurs entre le thread de chargement et le thread Tk."""
+
+    def test_worker_sends_chunks_then_sentinel(self):
+        grid = _headless_grid([])
+        grid.LOAD_CHUNK = 2
+        load_queue = queue.Queue()
+        grid._load_worker(lambda: [(i, i, i) for i in range(5)], load_queue)
+        items = [load_queue.get_nowait() for _ in range(load_queue.qsize())]
+        self.assertEqual([len(item) for item in items[:-1]], [2, 2, 1])
+        self.assertIsNone(items[-1])
+
+    def test_worker_posts_sentinel_on_any_error(self):
+        grid = _headless_grid([])
+        load_queue = queue.Queue()
+        grid._load_worker(lambda: 1 / 0, load_queue)
+        self.assertIsInstance(load_queue.get_nowait(), ZeroDivisionError)
+        self.assertIsNone(load_queue.get_nowait())
+
+    def test_poll_appends_loaded_colors(self):
+        grid = _headless_grid([])
+        grid._load_worker(lambda: [(1, 2, 3), (4, 5, 6)], grid._load_queue)
+        grid._poll_loader(grid._load_queue)
+        self.assertEqual(grid.colors, [(1, 2, 3), (4, 5, 6)])
+        self.assertEqual(grid.status.text, "2 couleurs")
+
+    def test_failed_reorder_keeps_previous_colors(self):
+        previous = [(10, 20, 30), (40, 50, 60)]
+        grid = _headless_grid(previous)
+        grid.reorder(lambda colors: 1 / 0)
+        self.assertEqual(grid.colors, [])
+        grid._loader.join()
+        grid._poll_loader(grid._load_queue)
+        self.assertEqual(grid.colors, previous)
+        self.assertTrue(grid.status.text.startswith("Erreur"))
+
+
+if __name__ == '__main__':
+    unittest.main()
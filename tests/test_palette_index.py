@@ -0,0 +1,57 @@
+"""Tests de l'index de palette par plages HSL/HSV."""
+
+import random
+import unittest
+
+from src.palette_index import PaletteIndex
+
+
+class TestPaletteIndexHue(unittest.TestCase):
+    """Requêtes de teinte avec bouclage autour de 0°."""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(42)
+        cls.index = PaletteIndex((rng.randrange(256), rng.randrange(256), rng.randrange(256))
+                                 for _ in range(5000))
+
+    def brute_force(self, predicate):
+        return sorted(entry.id for entry in self.index.query() if predicate(entry.hsl[0]))
+
+    def ids(self, **ranges):
+        return sorted(entry.id for entry in self.index.query(**ranges))
+
+    def test_plain_range(self):
+        self.assertEqual(self.ids(hue=(200, 240)), self.brute_force(lambda h: 200 <= h <= 240))
+
+    def test_wrapping_range(self):
+        expected = self.brute_force(lambda h: h >= 330 or h <= 30)
+        self.assertEqual(self.ids(hue=(330, 30)), expected)
+
+    def test_high_bound_above_360(self):
+        expected = self.brute_force(lambda h: h >= 350 or h <= 10)
+        self.assertEqual(self.ids(hue=(350, 370)), expected)
+
+    def test_negative_low_bound(self):
+        expected = self.brute_force(lambda h: h >= 350 or h <= 10)
+        self.assertEqual(self.ids(hue=(-10, 10)), expected)
+
+    def test_single_hue(self):
+        self.assertEqual(self.ids(hue=(360, 360)), self.brute_force(lambda h: h == 0))
+
+    def test_full_circle(self):
+        self.assertEqual(len(self.ids(hue=(0, 360))), len(self.index))
+        self.assertEqual(len(self.ids(hue=(10, 400))), len(self.index))
+
+    def test_combined_ranges(self):
+        expected = sorted(entry.id for entry in self.index.query()
+                          if (entry.hsl[0] >= 300 or entry.hsl[0] <= 20)
+                          and 40 <= entry.hsl[1] <= 100)
+        self.assertEqual(self.ids(hue=(300, 20), saturation=(40, 100)), expected)
+
+    def test_inverted_non_hue_range_is_empty(self):
+        self.assertEqual(self.ids(lightness=(60, 40)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
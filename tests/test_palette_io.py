@@ -0,0 +1,106 @@
+"""Tests de l'import/export de palettes."""
+
+import os
+import tempfile
+import unittest
+
+from src.palette_io import ACO_MAX_COLORS, PaletteEntry, convert_palette, read_palette, \
+    write_palette
+
+ENTRIES = [
+    PaletteEntry('Rouge', (255, 0, 0)),
+    PaletteEntry('Vert sapin', (1, 121, 111)),
+    PaletteEntry('Gris', (128, 128, 128)),
+    PaletteEntry('Noir', (0, 0, 0)),
+]
+
+
+class TestPaletteRoundTrip(unittest.TestCase):
+    """Écriture puis relecture dans chaque format."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_round_trip_all_formats(self):
+        for ext in ('.gpl', '.ase', '.aco', '.css', '.json'):
+            with self.subTest(ext=ext):
+                path = self.path(f"palette{ext}")
+                self.assertEqual(write_palette(ENTRIES, path), len(ENTRIES))
+                colors = [entry.rgb for entry in read_palette(path)]
+                self.assertEqual(colors, [entry.rgb for entry in ENTRIES])
+
+    def test_names_preserved(self):
+        for ext in ('.gpl', '.ase', '.aco', '.json'):
+            with self.subTest(ext=ext):
+                path = self.path(f"noms{ext}")
+                write_palette(ENTRIES, path)
+                self.assertEqual([entry.name for entry in read_palette(path)],
+                                 [entry.name for entry in ENTRIES])
+
+    def test_convert_palette(self):
+        source, target = self.path('a.gpl'), self.path('b.ase')
+        write_palette(ENTRIES, source)
+        self.assertEqual(convert_palette(source, target), len(ENTRIES))
+        self.assertEqual(list(read_palette(target)), list(read_palette(source)))
+
+    def test_unknown_extension(self):
+        with self.assertRaises(ValueError):
+            write_palette(ENTRIES, self.path('palette.xyz'))
+
+    def test_aco_limit_removes_partial_file(self):
+        path = self.path('trop.aco')
+        entries = (PaletteEntry('c', (i % 256, 0, 0)) for i in range(ACO_MAX_COLORS + 1))
+        with self.assertRaisesRegex(ValueError, 'ACO limité à 65535 couleurs'):
+            write_palette(entries, path)
+        self.assertFalse(os.path.exists(path))
+
+
+class TestPaletteReaders(unittest.TestCase):
+    """Lecture de fichiers mixtes, tronqués ou invalides."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_css_skips_non_color_properties(self):
+        path = self.path('styles.css')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(":root {\n  --z-index: 100;\n  --primary: #ff0000;\n"
+                    "  --gap: 4, 8, 12;\n  --accent: rgb(0, 128, 255);\n"
+                    "  --font: serif;\n  --muted: hsl(0, 0%, 50%);\n  --ratio: 1.5;\n}\n")
+        self.assertEqual([entry.name for entry in read_palette(path)],
+                         ['primary', 'accent', 'muted'])
+
+    def test_truncated_binary_files(self):
+        for ext in ('.ase', '.aco'):
+            path = self.path(f"complet{ext}")
+            write_palette(ENTRIES, path)
+            with open(path, 'rb') as f:
+                data = f.read()
+            for size in (6, 20, len(data) - 3):
+                with self.subTest(ext=ext, size=size):
+                    truncated = self.path(f"tronque{ext}")
+                    with open(truncated, 'wb') as f:
+                        f.write(data[:size])
+                    with self.assertRaisesRegex(ValueError, 'tronqué'):
+                        list(read_palette(truncated))
+
+    def test_json_invalid_rgb(self):
+        for item in ('{"rgb": 5}', '{"rgb": [1, 2]}', '{"rgb": "abc"}'):
+            with self.subTest(item=item):
+                path = self.path('invalide.json')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(f"[{item}]")
+                with self.assertRaises(ValueError):
+                    list(read_palette(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests de l'ordonnancement perceptuel de palettes."""
+
+import random
+import unittest
+
+from src.color_precision import PrecisionConverter
+from src.palette_dedup import delta_e
+from src.palette_order import hilbert_index, order_indices, sort_colors
+
+
+def _lab_path(colors):
+    labs = [PrecisionConverter.rgb_to_lab(*PrecisionConverter.from_8bit(*rgb)) for rgb in colors]
+    return sum(delta_e(a, b) for a, b in zip(labs, labs[1:]))
+
+
+class TestPaletteOrder(unittest.TestCase):
+    """Courbe de Hilbert, tri et affinage."""
+
+    def test_hilbert_steps_are_adjacent(self):
+        size = 8
+        cells = {hilbert_index(x, y, z, 3): (x, y, z)
+                 for x in range(size) for y in range(size) for z in range(size)}
+        self.assertEqual(sorted(cells), list(range(size ** 3)))
+        for index in range(size ** 3 - 1):
+            step = sum(abs(a - b) for a, b in zip(cells[index], cells[index + 1]))
+            self.assertEqual(step, 1)
+
+    def test_order_is_permutation(self):
+        rng = random.Random(7)
+        colors = [(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(500)]
+        for curve in ('hilbert', 'morton'):
+            for space in ('lab', 'hsl'):
+                with self.subTest(curve=curve, space=space):
+                    order = order_indices(colors, curve, space, refine=16)
+                    self.assertEqual(sorted(order), list(range(len(colors))))
+
+    def test_refine_shortens_lab_path(self):
+        rng = random.Random(3)
+        colors = [(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+                  for _ in range(2000)]
+        raw = _lab_path(sort_colors(colors))
+        refined = _lab_path(sort_colors(colors, refine=16))
+        self.assertLess(refined, raw)
+
+    def test_invalid_curve(self):
+        with self.assertRaises(ValueError):
+            sort_colors([(0, 0, 0)], curve='peano')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Tests du stockage binaire de palettes."""
+
+import os
+import tempfile
+import unittest
+from array import array
+
+from src.color_precision import PrecisionConverter
+from src.palette_store import PaletteStore, write_store
+
+COLORS = [(255, 0, 0), (0, 128, 255), (18, 52, 86), (0, 0, 0)]
+
+
+class TestPaletteStore(unittest.TestCase):
+    """Écriture, lecture mappée et conversion sans copie."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'palette.ccpal')
+
+    def test_round_trip(self):
+        write_store(self.path, COLORS, hsl=True, lab=True)
+        with PaletteStore(self.path) as store:
+            self.assertEqual(len(store), len(COLORS))
+            self.assertEqual([store[i] for i in range(len(store))], COLORS)
+            self.assertEqual(store[-1], COLORS[-1])
+
+    def test_alpha_rows(self):
+        write_store(self.path, [(1, 2, 3, 0.5), (4, 5, 6)], alpha=True)
+        with PaletteStore(self.path) as store:
+            self.assertEqual(store[0], (1, 2, 3, 0.502))
+            self.assertEqual(store[1], (4, 5, 6, 1.0))
+
+    def test_convert_matches_per_color(self):
+        write_store(self.path, [(*rgb, 1.0) for rgb in COLORS], alpha=True)
+        with PaletteStore(self.path) as store:
+            converted = store.convert('rgb_to_hsl')
+        expected = array('d')
+        for rgb in COLORS:
+            expected.extend(PrecisionConverter.rgb_to_hsl(*PrecisionConverter.from_8bit(*rgb)))
+        self.assertEqual(converted, expected)
+
+    def test_truncated_file_rejected(self):
+        write_store(self.path, COLORS * 250)
+        with open(self.path, 'r+b') as f:
+            f.truncate(100)
+        with self.assertRaises(ValueError):
+            PaletteStore(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests de la vérification des allers-retours de conversion."""
+
+import unittest
+
+from src.color_converter import ColorConverter
+from src.color_precision import PrecisionConverter
+from src.roundtrip_check import ROUNDTRIP_PAIRS, compare_engines, verify_roundtrip
+
+
+def _precise_cmyk(r, g, b):
+    """CMJN non arrondi, en % comme ColorConverter.rgb_to_cmyk."""
+    return PrecisionConverter.rgb_to_cmyk(r / 255.0, g / 255.0, b / 255.0)
+
+
+class TestRoundtripCheck(unittest.TestCase):
+    """Vérifications sur une petite plage, traitées dans le processus courant."""
+
+    def test_histogram_counts_every_value(self):
+        forward, inverse = ROUNDTRIP_PAIRS['hsl']
+        report = verify_roundtrip('hsl', forward, inverse, stop=4096)
+        self.assertEqual(report.total, 4096)
+        self.assertEqual(sum(report.histogram.values()), 4096)
+        self.assertEqual(report.failure_count, 4096 - report.histogram.get(0, 0))
+        self.assertEqual(len(report.failures), min(report.failure_count, 100))
+        for rgb, back in report.failures:
+            self.assertNotEqual(tuple(back), rgb)
+
+    def test_workers_one_matches_single_chunk(self):
+        forward, inverse = ROUNDTRIP_PAIRS['cmyk']
+        split = verify_roundtrip('cmyk', forward, inverse, stop=3000, chunk_size=512, workers=1)
+        whole = verify_roundtrip('cmyk', forward, inverse, stop=3000)
+        self.assertEqual(split.histogram, whole.histogram)
+        self.assertEqual(split.failure_count, whole.failure_count)
+
+    def test_compare_engines_tolerance(self):
+        # Le moteur arrondit au dixième : écart au plus 0,05 avec le calcul exact
+        exact = compare_engines('cmyk', ColorConverter.rgb_to_cmyk, _precise_cmyk,
+                                stop=2048, max_failures=5)
+        self.assertGreater(exact.failure_count, 0)
+        self.assertEqual(len(exact.failures), 5)
+
+        tolerant = compare_engines('cmyk', ColorConverter.rgb_to_cmyk, _precise_cmyk,
+                                   tolerance=0.05 + 1e-9, stop=2048)
+        self.assertEqual(tolerant.failure_count, 0)
+        self.assertEqual(sum(tolerant.histogram.values()), 2048)
+
+
+if __name__ == '__main__':
+    unittest.main()